@@ -3,6 +3,7 @@ common/admin.py
 """
 
 from django.contrib import admin
+from django.db import transaction
 
 from .models import (
     Asset,
@@ -13,9 +14,19 @@ from .models import (
     ExitRequest,
     HoldingShare,
     Investment,
+    InvestmentJob,
     Member,
+    MemberBalance,
     Penalty,
+    PositionCheckpoint,
     Reversal,
+    StatementSnapshot,
+)
+from .services.ledger_service import (
+    lock_ledger,
+    on_buyout_recorded,
+    on_contribution_recorded,
+    on_penalty_recorded,
 )
 
 
@@ -55,27 +66,121 @@ class ContributionWindowAdmin(admin.ModelAdmin):
 
 @admin.register(Contribution)
 class ContributionAdmin(admin.ModelAdmin):
-    """Contribution — read-only or minimal create (immutable)."""
+    """
+    Contribution — read-only or minimal create (immutable). Change and delete
+    would bypass the balance projections; corrections go through reversals.
+    """
 
-    list_display = ["member", "window", "amount", "recorded_at"]
-    list_filter = ["window", "recorded_at"]
+    list_display = ["member", "window", "amount", "recorded_at", "is_reversed"]
+    list_filter = ["window", "recorded_at", "is_reversed"]
     search_fields = ["member__email", "member__firstName"]
     readonly_fields = ["created_at"]
     ordering = ["-recorded_at"]
     raw_id_fields = ["member", "window"]
 
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            lock_ledger()
+            super().save_model(request, obj, form, change)
+            on_contribution_recorded(obj)
+
 
 @admin.register(Penalty)
 class PenaltyAdmin(admin.ModelAdmin):
-    """Penalty — read-only or minimal create (immutable)."""
+    """
+    Penalty — read-only or minimal create (immutable). Change and delete
+    would bypass the balance projections; corrections go through reversals.
+    """
 
-    list_display = ["member", "amount", "reason", "window", "recorded_at"]
-    list_filter = ["recorded_at"]
+    list_display = [
+        "member",
+        "amount",
+        "reason",
+        "window",
+        "recorded_at",
+        "is_reversed",
+    ]
+    list_filter = ["recorded_at", "is_reversed"]
     search_fields = ["member__email", "reason"]
     readonly_fields = ["created_at"]
     ordering = ["-recorded_at"]
     raw_id_fields = ["member", "window"]
 
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            lock_ledger()
+            super().save_model(request, obj, form, change)
+            on_penalty_recorded(obj)
+
+
+@admin.register(MemberBalance)
+class MemberBalanceAdmin(admin.ModelAdmin):
+    """Member balance — projection, read-only."""
+
+    list_display = [
+        "member",
+        "contributions_total",
+        "penalties_total",
+        "eligible_savings",
+        "updated_at",
+    ]
+    search_fields = ["member__email"]
+    ordering = ["-updated_at"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(PositionCheckpoint)
+class PositionCheckpointAdmin(admin.ModelAdmin):
+    """Position checkpoint — written by create_position_checkpoints, read-only."""
+
+    list_display = ["member", "as_of", "contributions_total", "penalties_total"]
+    list_filter = ["as_of"]
+    search_fields = ["member__email"]
+    ordering = ["-as_of"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(StatementSnapshot)
+class StatementSnapshotAdmin(admin.ModelAdmin):
+    """Statement snapshot — written by create_statement_snapshots, read-only."""
+
+    list_display = ["member", "window", "period_start", "period_end", "created_at"]
+    list_filter = ["window"]
+    search_fields = ["member__email"]
+    ordering = ["-period_start"]
+    exclude = ["sections"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(Investment)
 class InvestmentAdmin(admin.ModelAdmin):
@@ -87,17 +192,53 @@ class InvestmentAdmin(admin.ModelAdmin):
     ordering = ["-recorded_at"]
 
 
+@admin.register(InvestmentJob)
+class InvestmentJobAdmin(admin.ModelAdmin):
+    """Investment job — created via POST /admin/investments/ (async), read-only."""
+
+    list_display = [
+        "id",
+        "status",
+        "recorded_at",
+        "unit_value",
+        "members_processed",
+        "members_total",
+        "investment",
+        "created_at",
+    ]
+    list_filter = ["status"]
+    ordering = ["-created_at"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(HoldingShare)
 class HoldingShareAdmin(admin.ModelAdmin):
-    """Holding share — immutable."""
+    """
+    Holding share — immutable, read-only. Created with their investment so
+    the holdings projection stays in step; corrections go through reversals.
+    """
 
-    list_display = ["investment", "member", "units", "created_at"]
-    list_filter = ["investment"]
+    list_display = ["investment", "member", "units", "created_at", "is_reversed"]
+    list_filter = ["investment", "is_reversed"]
     search_fields = ["member__email"]
     readonly_fields = ["created_at"]
     ordering = ["-created_at"]
     raw_id_fields = ["investment", "member"]
 
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(Asset)
 class AssetAdmin(admin.ModelAdmin):
@@ -119,19 +260,40 @@ class AssetAdmin(admin.ModelAdmin):
 
 @admin.register(AssetShare)
 class AssetShareAdmin(admin.ModelAdmin):
-    """Asset share — immutable."""
+    """
+    Asset share — immutable, read-only. Created with their asset, whose
+    percentages sum to exactly 100; corrections go through reversals.
+    """
 
-    list_display = ["asset", "member", "share_percentage", "created_at"]
-    list_filter = ["asset"]
+    list_display = [
+        "asset",
+        "member",
+        "share_percentage",
+        "created_at",
+        "is_reversed",
+    ]
+    list_filter = ["asset", "is_reversed"]
     search_fields = ["member__email"]
     readonly_fields = ["created_at"]
     ordering = ["-created_at"]
     raw_id_fields = ["asset", "member"]
 
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(Reversal)
 class ReversalAdmin(admin.ModelAdmin):
-    """Reversal — audit trail only."""
+    """
+    Reversal — audit trail only. Created through POST /admin/reversals/ so the
+    reversed record's is_reversed flag is set in the same transaction.
+    """
 
     list_display = ["original_record_type", "original_record_id", "reason", "created_at"]
     list_filter = ["original_record_type"]
@@ -139,10 +301,24 @@ class ReversalAdmin(admin.ModelAdmin):
     readonly_fields = ["created_at"]
     ordering = ["-created_at"]
 
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(ExitRequest)
 class ExitRequestAdmin(admin.ModelAdmin):
-    """Exit request — queue and status."""
+    """
+    Exit request — queue and status, read-only. Requests are created through
+    POST /admin/exit-requests/ (positions come from the ExitQueue counter) and
+    change status through /<id>/cancel/ and /fulfill/, which advance the queue
+    and member versions.
+    """
 
     list_display = [
         "id",
@@ -152,17 +328,30 @@ class ExitRequestAdmin(admin.ModelAdmin):
         "amount_entitled",
         "requested_at",
         "fulfilled_at",
+        "is_reversed",
     ]
-    list_filter = ["status"]
+    list_filter = ["status", "is_reversed"]
     search_fields = ["member__email"]
     readonly_fields = ["created_at"]
     ordering = ["queue_position", "-requested_at"]
     raw_id_fields = ["member"]
 
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(BuyOut)
 class BuyOutAdmin(admin.ModelAdmin):
-    """Buy out — immutable."""
+    """
+    Buy out — read-only or minimal create (immutable). Change and delete
+    would bypass the ledger versions; corrections go through reversals.
+    """
 
     list_display = [
         "id",
@@ -171,9 +360,22 @@ class BuyOutAdmin(admin.ModelAdmin):
         "nominal_valuation",
         "recorded_at",
         "created_at",
+        "is_reversed",
     ]
-    list_filter = ["recorded_at"]
+    list_filter = ["recorded_at", "is_reversed"]
     search_fields = ["seller__email", "buyer__email"]
     readonly_fields = ["created_at"]
     ordering = ["-recorded_at"]
     raw_id_fields = ["seller", "buyer", "created_by"]
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            lock_ledger()
+            super().save_model(request, obj, form, change)
+            on_buyout_recorded(obj)
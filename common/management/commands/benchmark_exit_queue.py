@@ -0,0 +1,101 @@
+"""
+manage.py benchmark_exit_queue [--workers N] [--per-worker N]
+Concurrent load test of exit request creation: each worker thread creates exit
+requests through create_exit_request, so it contends on the ledger lock and
+the ExitQueue counter as production does, and the run checks that every queue
+position was handed out exactly once and without gaps.
+Runs against a throwaway test database (created and destroyed by the command),
+so the live queue counter, versions and rank cache are never touched.
+"""
+
+import statistics
+import threading
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from common.models import Member
+from common.services.exit_service import create_exit_request
+
+
+class Command(BaseCommand):
+    help = "Benchmark concurrent exit request creation on a test database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument("--per-worker", type=int, default=100)
+
+    def handle(self, *args, **options):
+        workers, per_worker = options["workers"], options["per_worker"]
+        if workers < 1 or per_worker < 1:
+            raise CommandError("--workers and --per-worker must be at least 1.")
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False
+        )
+        try:
+            positions, latencies, elapsed = self._run(workers, per_worker)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        duplicates = len(positions) - len(set(positions))
+        contiguous = sorted(positions) == list(range(1, len(positions) + 1))
+        latencies.sort()
+        self.stdout.write(
+            f"{len(positions)} positions in {elapsed:.3f}s "
+            f"({len(positions) / elapsed:.0f}/s) with {workers} workers; "
+            f"p50 {statistics.median(latencies) * 1000:.2f}ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f}ms"
+        )
+        if duplicates or not contiguous:
+            raise CommandError(
+                f"Queue positions are not unique and contiguous "
+                f"({duplicates} duplicates)."
+            )
+        self.stdout.write("All positions unique and contiguous.")
+
+    def _run(self, workers: int, per_worker: int) -> tuple[list, list, float]:
+        """Create per_worker exit requests from each of workers threads."""
+        members = [
+            Member.objects.create(
+                firstName="Benchmark",
+                lastName=str(n),
+                email=f"benchmark{n}@example.com",
+                phone=f"+0{n:09d}",
+                nationalId=f"bench{n}",
+                joinDate=date.today(),
+            )
+            for n in range(workers)
+        ]
+        positions, latencies, errors = [], [], []
+        lock = threading.Lock()
+        start_barrier = threading.Barrier(workers)
+
+        def work(member_id):
+            taken, timings = [], []
+            try:
+                start_barrier.wait()
+                for _ in range(per_worker):
+                    started = time.perf_counter()
+                    taken.append(create_exit_request(member_id).queue_position)
+                    timings.append(time.perf_counter() - started)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+            with lock:
+                positions.extend(taken)
+                latencies.extend(timings)
+
+        threads = [threading.Thread(target=work, args=(m.pk,)) for m in members]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        if errors:
+            raise CommandError(f"{len(errors)} worker(s) failed: {errors[0]}")
+        return positions, latencies, elapsed
@@ -0,0 +1,33 @@
+"""
+manage.py create_position_checkpoints [--as-of YYYY-MM-DD]
+Snapshot every member's ledger totals; run at each contribution window close.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.services.checkpoint_service import (
+    create_position_checkpoints,
+    default_checkpoint_date,
+)
+
+
+class Command(BaseCommand):
+    help = "Write per-member position checkpoints (default date: last window close)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--as-of", dest="as_of", help="YYYY-MM-DD.")
+
+    def handle(self, *args, **options):
+        if options["as_of"]:
+            try:
+                as_of = date.fromisoformat(options["as_of"])
+            except ValueError as e:
+                raise CommandError("--as-of must be YYYY-MM-DD.") from e
+        else:
+            as_of = default_checkpoint_date()
+        count = create_position_checkpoints(as_of)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {count} position checkpoints as of {as_of}.")
+        )
@@ -0,0 +1,37 @@
+"""
+manage.py create_statement_snapshots [--window ID]
+Snapshot member statements for closed contribution windows; run after a window
+closes (and to rebuild snapshots invalidated by reversals or backdated writes).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.models import ContributionWindow
+from common.services.statement_service import (
+    create_statement_snapshots,
+    windows_needing_snapshots,
+)
+
+
+class Command(BaseCommand):
+    help = "Write statement snapshots for closed windows missing them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--window", type=int, help="Only this window id.")
+
+    def handle(self, *args, **options):
+        if options["window"] is not None:
+            windows = ContributionWindow.objects.filter(pk=options["window"])
+            if not windows.exists():
+                raise CommandError(f"Window {options['window']} not found.")
+        else:
+            windows = windows_needing_snapshots()
+        total = 0
+        for window in windows:
+            try:
+                count = create_statement_snapshots(window)
+            except ValueError as e:
+                raise CommandError(f"Window {window.pk}: {e}.") from e
+            total += count
+            self.stdout.write(f"Window {window.pk}: {count} snapshots")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {total} statement snapshots."))
@@ -0,0 +1,42 @@
+"""
+manage.py generate_annual_statements --year YYYY --output-dir DIR
+    [--format json|csv] [--workers N]
+Year-end statement for every member, one file each plus manifest.json.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.services.annual_statement_service import (
+    FORMATS,
+    generate_annual_statements,
+)
+
+
+class Command(BaseCommand):
+    help = "Generate every member's annual statement on a process pool."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, required=True)
+        parser.add_argument("--output-dir", dest="output_dir", required=True)
+        parser.add_argument("--format", dest="fmt", choices=FORMATS, default="json")
+        parser.add_argument(
+            "--workers", type=int, help="Worker processes (default: CPU count)."
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] is not None and options["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+        manifest = generate_annual_statements(
+            options["year"],
+            options["output_dir"],
+            fmt=options["fmt"],
+            workers=options["workers"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {manifest['member_count']} statements in "
+                f"{manifest['elapsed_seconds']}s "
+                f"({manifest['statements_per_second']}/s, "
+                f"{manifest['workers']} workers) to {options['output_dir']}."
+            )
+        )
@@ -0,0 +1,67 @@
+"""
+manage.py run_investment_jobs [--job ID] [--chunk-size N] [--loop]
+Local DB-backed worker for async investments (POST /admin/investments/ with
+async=true). Resumes running jobs left by a crashed worker.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.models import InvestmentJob
+from common.services.investment_service import (
+    INVESTMENT_JOB_CHUNK_SIZE,
+    OPEN_JOB_STATUSES,
+    retry_investment_job,
+    run_investment_job,
+)
+
+
+class Command(BaseCommand):
+    help = "Run queued investment jobs in resumable chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job", type=int, help="Run (or retry, if failed) only this job."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=INVESTMENT_JOB_CHUNK_SIZE
+        )
+        parser.add_argument(
+            "--loop", action="store_true", help="Keep polling for new jobs."
+        )
+        parser.add_argument("--poll-interval", type=float, default=2.0)
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        if options["job"] is not None:
+            job = InvestmentJob.objects.filter(pk=options["job"]).first()
+            if job is None:
+                raise CommandError(f"Investment job {options['job']} not found.")
+            retry_investment_job(job)
+            self._run(job.pk, options["chunk_size"])
+            return
+        while True:
+            job_ids = list(
+                InvestmentJob.objects.filter(status__in=OPEN_JOB_STATUSES)
+                .order_by("created_at")
+                .values_list("pk", flat=True)
+            )
+            for job_id in job_ids:
+                self._run(job_id, options["chunk_size"])
+            if not options["loop"]:
+                break
+            time.sleep(options["poll_interval"])
+
+    def _run(self, job_id, chunk_size):
+        try:
+            job = run_investment_job(job_id, chunk_size=chunk_size)
+        except Exception as e:
+            self.stderr.write(f"Investment job {job_id} failed: {e}")
+            return
+        if job is not None:
+            self.stdout.write(
+                f"Investment job {job.pk}: {job.status}, "
+                f"{job.members_processed}/{job.members_total} members"
+            )
@@ -0,0 +1,94 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+REVERSIBLE_MODELS = {
+    "contribution": "Contribution",
+    "penalty": "Penalty",
+    "holding_share": "HoldingShare",
+    "asset_share": "AssetShare",
+    "exit_request": "ExitRequest",
+    "buy_out": "BuyOut",
+}
+
+
+def flag_reversed_records(apps, schema_editor):
+    """Backfill is_reversed from existing Reversal rows."""
+    Reversal = apps.get_model("common", "Reversal")
+    for record_type, model_name in REVERSIBLE_MODELS.items():
+        model = apps.get_model("common", model_name)
+        reversed_ids = Reversal.objects.filter(
+            original_record_type=record_type
+        ).values("original_record_id")
+        model.objects.filter(pk__in=reversed_ids).update(is_reversed=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_buyout_exitrequest'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='assetshare',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='buyout',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='contribution',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='exitrequest',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='holdingshare',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='penalty',
+            name='is_reversed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='assetshare',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['member', 'asset'], name='assetshare_member_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='buyout',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['seller', 'recorded_at'], name='buyout_seller_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='buyout',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['buyer', 'recorded_at'], name='buyout_buyer_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['member', 'recorded_at'], include=('amount',), name='contribution_member_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exitrequest',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['member', 'requested_at'], name='exitrequest_member_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='holdingshare',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['member', 'investment'], include=('units',), name='holdingshare_member_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='penalty',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['member', 'recorded_at'], include=('amount',), name='penalty_member_active_idx'),
+        ),
+        migrations.RunPython(flag_reversed_records, migrations.RunPython.noop),
+    ]
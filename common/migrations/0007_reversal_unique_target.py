@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_is_reversed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='reversal',
+            constraint=models.UniqueConstraint(fields=('original_record_type', 'original_record_id'), name='reversal_unique_target'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:23
+
+import django.db.models.deletion
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+
+def backfill_member_balances(apps, schema_editor):
+    """Build MemberBalance rows from non-reversed contributions and penalties."""
+    Contribution = apps.get_model("common", "Contribution")
+    Penalty = apps.get_model("common", "Penalty")
+    MemberBalance = apps.get_model("common", "MemberBalance")
+
+    def totals(model):
+        return dict(
+            model.objects.filter(is_reversed=False)
+            .values("member_id")
+            .annotate(total=Sum("amount"))
+            .values_list("member_id", "total")
+        )
+
+    contributions = totals(Contribution)
+    penalties = totals(Penalty)
+    MemberBalance.objects.bulk_create(
+        [
+            MemberBalance(
+                member_id=member_id,
+                contributions_total=contributions.get(member_id, Decimal("0")),
+                penalties_total=penalties.get(member_id, Decimal("0")),
+                eligible_savings=contributions.get(member_id, Decimal("0"))
+                - penalties.get(member_id, Decimal("0")),
+            )
+            for member_id in set(contributions) | set(penalties)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0007_reversal_unique_target'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberBalance',
+            fields=[
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='balance', serialize=False, to='common.member')),
+                ('contributions_total', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('penalties_total', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('eligible_savings', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Member balance',
+                'verbose_name_plural': 'Member balances',
+            },
+        ),
+        migrations.RunPython(backfill_member_balances, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:27
+
+from django.db import migrations, models
+
+
+def create_group_balance(apps, schema_editor):
+    """Create the single GroupBalance row."""
+    GroupBalance = apps.get_model("common", "GroupBalance")
+    GroupBalance.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0008_memberbalance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroupBalance',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Group balance',
+                'verbose_name_plural': 'Group balance',
+            },
+        ),
+        migrations.AddField(
+            model_name='memberbalance',
+            name='version',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.RunPython(create_group_balance, migrations.RunPython.noop),
+    ]
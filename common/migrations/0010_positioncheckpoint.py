@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_ledger_versions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PositionCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('as_of', models.DateField()),
+                ('contributions_total', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('penalties_total', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='position_checkpoints', to='common.member')),
+            ],
+            options={
+                'verbose_name': 'Position checkpoint',
+                'verbose_name_plural': 'Position checkpoints',
+                'ordering': ['-as_of'],
+                'constraints': [models.UniqueConstraint(fields=('member', 'as_of'), name='positioncheckpoint_member_as_of_uniq')],
+            },
+        ),
+    ]
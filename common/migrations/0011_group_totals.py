@@ -0,0 +1,62 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:35
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F, Sum
+
+
+def backfill_group_totals(apps, schema_editor):
+    """Compute group totals from non-reversed ledger rows."""
+    Member = apps.get_model("common", "Member")
+    Contribution = apps.get_model("common", "Contribution")
+    Penalty = apps.get_model("common", "Penalty")
+    HoldingShare = apps.get_model("common", "HoldingShare")
+    GroupBalance = apps.get_model("common", "GroupBalance")
+
+    def total(queryset, expression):
+        return queryset.aggregate(total=Sum(expression))["total"] or Decimal("0")
+
+    GroupBalance.objects.update_or_create(
+        pk=1,
+        defaults={
+            "member_count": Member.objects.count(),
+            "pool_total": total(Contribution.objects.filter(is_reversed=False), "amount"),
+            "penalties_total": total(Penalty.objects.filter(is_reversed=False), "amount"),
+            "holdings_value": total(
+                HoldingShare.objects.filter(is_reversed=False),
+                F("units") * F("investment__unit_value"),
+            ),
+        },
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0010_positioncheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupbalance',
+            name='holdings_value',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=24),
+        ),
+        migrations.AddField(
+            model_name='groupbalance',
+            name='member_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='groupbalance',
+            name='penalties_total',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=20),
+        ),
+        migrations.AddField(
+            model_name='groupbalance',
+            name='pool_total',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=20),
+        ),
+        migrations.RunPython(backfill_group_totals, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0011_group_totals'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatementSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateField()),
+                ('period_end', models.DateField()),
+                ('sections', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statement_snapshots', to='common.member')),
+                ('window', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='statement_snapshots', to='common.contributionwindow')),
+            ],
+            options={
+                'verbose_name': 'Statement snapshot',
+                'verbose_name_plural': 'Statement snapshots',
+                'ordering': ['member', 'period_start'],
+                'indexes': [models.Index(fields=['member', 'period_start', 'period_end'], name='statementsnapshot_period_idx')],
+                'constraints': [models.UniqueConstraint(fields=('member', 'window'), name='statementsnapshot_member_window_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0012_statementsnapshot'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['recorded_at'], include=('member', 'amount'), name='contribution_date_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='penalty',
+            index=models.Index(condition=models.Q(('is_reversed', False)), fields=['recorded_at'], include=('member', 'amount'), name='penalty_date_active_idx'),
+        ),
+    ]
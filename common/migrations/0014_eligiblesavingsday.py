@@ -0,0 +1,71 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:48
+
+from collections import defaultdict
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_eligible_savings_days(apps, schema_editor):
+    """Build running totals from non-reversed contributions and penalties."""
+    Contribution = apps.get_model("common", "Contribution")
+    Penalty = apps.get_model("common", "Penalty")
+    EligibleSavingsDay = apps.get_model("common", "EligibleSavingsDay")
+
+    deltas = defaultdict(Decimal)
+    for model, sign in ((Contribution, 1), (Penalty, -1)):
+        rows = (
+            model.objects.filter(is_reversed=False)
+            .annotate(day=TruncDate("recorded_at"))
+            .values("member_id", "day")
+            .annotate(total=Sum("amount"))
+            .values_list("member_id", "day", "total")
+        )
+        for member_id, day, total in rows:
+            deltas[(member_id, day)] += sign * total
+
+    days = []
+    running = defaultdict(Decimal)
+    for (member_id, day), delta in sorted(
+        deltas.items(), key=lambda item: (str(item[0][0]), item[0][1])
+    ):
+        running[member_id] += delta
+        days.append(
+            EligibleSavingsDay(
+                member_id=member_id,
+                day=day,
+                daily_delta=delta,
+                running_total=running[member_id],
+            )
+        )
+    EligibleSavingsDay.objects.bulk_create(days, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0013_recorded_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EligibleSavingsDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('daily_delta', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('running_total', models.DecimalField(decimal_places=4, default=0, max_digits=20)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligible_savings_days', to='common.member')),
+            ],
+            options={
+                'verbose_name': 'Eligible savings day',
+                'verbose_name_plural': 'Eligible savings days',
+                'ordering': ['member', 'day'],
+                'constraints': [models.UniqueConstraint(fields=('member', 'day'), name='eligiblesavingsday_member_day_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_eligible_savings_days, migrations.RunPython.noop),
+    ]
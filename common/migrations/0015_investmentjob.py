@@ -0,0 +1,56 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0014_eligiblesavingsday'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvestmentJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('recorded_at', models.DateField()),
+                ('unit_value', models.DecimalField(decimal_places=4, max_digits=20)),
+                ('total_units', models.DecimalField(blank=True, decimal_places=4, max_digits=20, null=True)),
+                ('members_total', models.PositiveIntegerField(default=0)),
+                ('members_processed', models.PositiveIntegerField(default=0)),
+                ('last_member_id', models.UUIDField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Investment job',
+                'verbose_name_plural': 'Investment jobs',
+                'ordering': ['created_at'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='holdingshare',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_reversed', False)), fields=('investment', 'member'), name='holdingshare_active_uniq'),
+        ),
+        migrations.AddField(
+            model_name='investmentjob',
+            name='created_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='investmentjob',
+            name='investment',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='job', to='common.investment'),
+        ),
+        migrations.AddIndex(
+            model_name='investmentjob',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'running'])), fields=['created_at'], name='investmentjob_open_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0015_investmentjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='investmentjob',
+            name='allocated_units',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=20),
+        ),
+        migrations.AddField(
+            model_name='investmentjob',
+            name='cutoff_member_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='investmentjob',
+            name='eligible_total',
+            field=models.DecimalField(decimal_places=4, default=0, max_digits=20),
+        ),
+        migrations.AddField(
+            model_name='investmentjob',
+            name='remainder_cutoff',
+            field=models.DecimalField(blank=True, decimal_places=0, max_digits=40, null=True),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:01
+
+from django.db import migrations, models
+from django.db.models import Max
+
+
+def seed_exit_queue(apps, schema_editor):
+    """
+    Start the counter after every position handed out so far, moving any
+    duplicate queued positions (from concurrent creates) to the end in
+    requested_at order so the unique constraint can be added.
+    """
+    ExitRequest = apps.get_model("common", "ExitRequest")
+    ExitQueue = apps.get_model("common", "ExitQueue")
+    last_position = ExitRequest.objects.aggregate(m=Max("queue_position"))["m"]
+    next_position = (last_position or 0) + 1
+    seen = set()
+    queued = ExitRequest.objects.filter(status="queued", is_reversed=False).order_by(
+        "queue_position", "requested_at", "id"
+    )
+    for req in queued:
+        if req.queue_position in seen:
+            req.queue_position = next_position
+            req.save(update_fields=["queue_position"])
+            next_position += 1
+        seen.add(req.queue_position)
+    ExitQueue.objects.update_or_create(pk=1, defaults={"next_position": next_position})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0016_investmentjob_allocation'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExitQueue',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False)),
+                ('next_position', models.PositiveIntegerField(default=1)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Exit queue',
+                'verbose_name_plural': 'Exit queue',
+            },
+        ),
+        migrations.RunPython(seed_exit_queue, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='exitrequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_reversed', False), ('status', 'queued')), fields=('queue_position',), name='exitrequest_queued_pos_uniq'),
+        ),
+    ]
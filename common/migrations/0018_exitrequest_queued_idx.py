@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0017_exitqueue'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='exitrequest',
+            index=models.Index(condition=models.Q(('is_reversed', False), ('status', 'queued')), fields=['queue_position', 'id'], name='exitrequest_queued_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0018_exitrequest_queued_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exitqueue',
+            name='version',
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def snapshot_running_jobs(apps, schema_editor):
+    """Snapshot remaining members of jobs already running (past their cursor)."""
+    InvestmentJob = apps.get_model("common", "InvestmentJob")
+    InvestmentJobMember = apps.get_model("common", "InvestmentJobMember")
+    EligibleSavingsDay = apps.get_model("common", "EligibleSavingsDay")
+    for job in InvestmentJob.objects.filter(status__in=["running", "failed"]).exclude(
+        investment=None
+    ):
+        rows = (
+            EligibleSavingsDay.objects.filter(day__lte=job.recorded_at)
+            .order_by("member_id", "-day")
+            .distinct("member_id")
+            .values_list("member_id", "running_total")
+        )
+        if job.last_member_id is not None:
+            rows = rows.filter(member_id__gt=job.last_member_id)
+        InvestmentJobMember.objects.bulk_create(
+            [
+                InvestmentJobMember(job=job, member_id=member_id, eligible_savings=amount)
+                for member_id, amount in rows
+                if amount > 0
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0019_exitqueue_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InvestmentJobMember',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eligible_savings', models.DecimalField(decimal_places=4, max_digits=20)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='members', to='common.investmentjob')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='common.member')),
+            ],
+            options={
+                'verbose_name': 'Investment job member',
+                'verbose_name_plural': 'Investment job members',
+                'constraints': [models.UniqueConstraint(fields=('job', 'member'), name='investmentjobmember_uniq')],
+            },
+        ),
+        migrations.RunPython(snapshot_running_jobs, migrations.RunPython.noop),
+    ]
@@ -7,12 +7,19 @@ from .asset_share import AssetShare
 from .buy_out import BuyOut
 from .contribution import Contribution
 from .contribution_window import ContributionWindow
+from .eligible_savings_day import EligibleSavingsDay
+from .exit_queue import ExitQueue
 from .exit_request import ExitRequest, ExitRequestStatus
+from .group_balance import GroupBalance
 from .holding_share import HoldingShare
 from .investment import Investment
+from .investment_job import InvestmentJob, InvestmentJobMember, InvestmentJobStatus
 from .member import Member
+from .member_balance import MemberBalance
 from .penalty import Penalty
+from .position_checkpoint import PositionCheckpoint
 from .reversal import Reversal, ReversalRecordType
+from .statement_snapshot import StatementSnapshot
 
 __all__ = [
     "Asset",
@@ -20,12 +27,21 @@ __all__ = [
     "BuyOut",
     "Contribution",
     "ContributionWindow",
+    "EligibleSavingsDay",
+    "ExitQueue",
     "ExitRequest",
     "ExitRequestStatus",
+    "GroupBalance",
     "HoldingShare",
     "Investment",
+    "InvestmentJob",
+    "InvestmentJobMember",
+    "InvestmentJobStatus",
     "Member",
+    "MemberBalance",
     "Penalty",
+    "PositionCheckpoint",
     "Reversal",
     "ReversalRecordType",
+    "StatementSnapshot",
 ]
@@ -3,6 +3,8 @@ AssetShare model — member's share percentage in an asset (immutable, fixed at
 """
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class AssetShare(models.Model):
     """
@@ -24,11 +26,22 @@ class AssetShare(models.Model):
         max_digits=20, decimal_places=4
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
+
+    reversal_record_type = ReversalRecordType.ASSET_SHARE
+    objects = ReversibleQuerySet.as_manager()
 
     class Meta:
         ordering = ["-created_at"]
         verbose_name = "Asset share"
         verbose_name_plural = "Asset shares"
+        indexes = [
+            models.Index(
+                fields=["member", "asset"],
+                condition=models.Q(is_reversed=False),
+                name="assetshare_member_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.member_id} {self.share_percentage}% of {self.asset_id}"
@@ -5,6 +5,8 @@ BuyOut model — immutable record of ownership transfer at nominal valuation.
 from django.conf import settings
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class BuyOut(models.Model):
     """
@@ -28,6 +30,7 @@ class BuyOut(models.Model):
     valuation_inputs = models.JSONField(default=dict, blank=True)
     recorded_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -36,6 +39,9 @@ class BuyOut(models.Model):
         related_name="+",
     )
 
+    reversal_record_type = ReversalRecordType.BUY_OUT
+    objects = ReversibleQuerySet.as_manager()
+
     class Meta:
         """
         Buy out meta
@@ -44,6 +50,18 @@ class BuyOut(models.Model):
         ordering = ["-recorded_at"]
         verbose_name = "Buy out"
         verbose_name_plural = "Buy outs"
+        indexes = [
+            models.Index(
+                fields=["seller", "recorded_at"],
+                condition=models.Q(is_reversed=False),
+                name="buyout_seller_active_idx",
+            ),
+            models.Index(
+                fields=["buyer", "recorded_at"],
+                condition=models.Q(is_reversed=False),
+                name="buyout_buyer_active_idx",
+            ),
+        ]
 
     def __str__(self):
         """
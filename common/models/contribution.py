@@ -3,6 +3,8 @@ Contribution model — single immutable record of a member's savings payment wit
 """
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class Contribution(models.Model):
     """
@@ -23,11 +25,30 @@ class Contribution(models.Model):
     amount = models.DecimalField(max_digits=20, decimal_places=4)
     recorded_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
+
+    reversal_record_type = ReversalRecordType.CONTRIBUTION
+    objects = ReversibleQuerySet.as_manager()
 
     class Meta:
         ordering = ["-recorded_at"]
         verbose_name = "Contribution"
         verbose_name_plural = "Contributions"
+        indexes = [
+            models.Index(
+                fields=["member", "recorded_at"],
+                include=["amount"],
+                condition=models.Q(is_reversed=False),
+                name="contribution_member_active_idx",
+            ),
+            # Group-wide "as of date" sums (eligible savings, checkpoints)
+            models.Index(
+                fields=["recorded_at"],
+                include=["member", "amount"],
+                condition=models.Q(is_reversed=False),
+                name="contribution_date_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Contribution {self.amount} by {self.member_id} in {self.window_id}"
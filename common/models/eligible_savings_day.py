@@ -0,0 +1,43 @@
+"""
+EligibleSavingsDay model — per-member, per-day running total of eligible savings.
+"""
+from django.db import models
+
+
+class EligibleSavingsDay(models.Model):
+    """
+    One row per member per day with ledger activity: daily_delta is that day's
+    non-reversed contributions minus penalties, running_total the member's
+    eligible savings at the end of the day. Eligible savings as of D is the
+    running_total of the latest row with day <= D (0 if none).
+    Maintained by LedgerProjectionService on writes and reversals.
+    """
+
+    member = models.ForeignKey(
+        "common.Member",
+        on_delete=models.CASCADE,
+        related_name="eligible_savings_days",
+    )
+    day = models.DateField()
+    daily_delta = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    running_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+
+    class Meta:
+        """
+        Eligible savings day meta
+        """
+        ordering = ["member", "day"]
+        verbose_name = "Eligible savings day"
+        verbose_name_plural = "Eligible savings days"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["member", "day"],
+                name="eligiblesavingsday_member_day_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the eligible savings day
+        """
+        return f"{self.member_id} {self.day}: {self.running_total}"
@@ -0,0 +1,38 @@
+"""
+ExitQueue model — single-row counter for FIFO exit queue positions.
+"""
+from django.db import models
+
+EXIT_QUEUE_ID = 1
+
+
+class ExitQueue(models.Model):
+    """
+    Single row (pk EXIT_QUEUE_ID) holding the next exit queue position.
+    create_exit_request locks this row (SELECT ... FOR UPDATE) to take a
+    position, so concurrent requests on any node get distinct, increasing
+    positions; only position allocation waits on the lock. Positions are never
+    reused, so gaps are expected after fulfilments and cancellations.
+    version advances whenever the set of queued requests changes; live queue
+    ranks are cached per version and it is part of the position ETag.
+    """
+
+    id = models.PositiveSmallIntegerField(
+        primary_key=True, default=EXIT_QUEUE_ID, editable=False
+    )
+    next_position = models.PositiveIntegerField(default=1)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Exit queue meta
+        """
+        verbose_name = "Exit queue"
+        verbose_name_plural = "Exit queue"
+
+    def __str__(self):
+        """
+        String representation of the exit queue
+        """
+        return f"Exit queue (next position {self.next_position})"
@@ -5,6 +5,8 @@ Immutable creation; status/fulfilled_at updated when fulfilled or cancelled.
 
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class ExitRequestStatus(models.TextChoices):
     """Status of an exit request."""
@@ -17,7 +19,8 @@ class ExitRequestStatus(models.TextChoices):
 class ExitRequest(models.Model):
     """
     Immutable record that a member has requested early exit.
-    queue_position assigned FIFO; status/fulfilled_at set when fulfilled or cancelled.
+    queue_position assigned FIFO from the ExitQueue counter, unique among active
+    queued requests; status/fulfilled_at set when fulfilled or cancelled.
     """
 
     member = models.ForeignKey(
@@ -35,11 +38,34 @@ class ExitRequest(models.Model):
     fulfilled_at = models.DateTimeField(null=True, blank=True)
     amount_entitled = models.DecimalField(max_digits=20, decimal_places=4, default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
+
+    reversal_record_type = ReversalRecordType.EXIT_REQUEST
+    objects = ReversibleQuerySet.as_manager()
 
     class Meta:
         ordering = ["queue_position", "-requested_at"]
         verbose_name = "Exit request"
         verbose_name_plural = "Exit requests"
+        indexes = [
+            models.Index(
+                fields=["member", "requested_at"],
+                condition=models.Q(is_reversed=False),
+                name="exitrequest_member_active_idx",
+            ),
+            models.Index(
+                fields=["queue_position", "id"],
+                condition=models.Q(status="queued", is_reversed=False),
+                name="exitrequest_queued_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["queue_position"],
+                condition=models.Q(status="queued", is_reversed=False),
+                name="exitrequest_queued_pos_uniq",
+            ),
+        ]
 
     def __str__(self):
         """
@@ -0,0 +1,38 @@
+"""
+GroupBalance model — single-row group-level ledger state and totals.
+"""
+from django.db import models
+
+GROUP_BALANCE_ID = 1
+
+
+class GroupBalance(models.Model):
+    """
+    Single row (pk GROUP_BALANCE_ID) of group-level ledger state.
+    Totals are maintained by the write services (non-reversed records only) so
+    group aggregates are a primary-key read.
+    version advances on every ledger write; used as a cache validator (ETag).
+    """
+
+    id = models.PositiveSmallIntegerField(
+        primary_key=True, default=GROUP_BALANCE_ID, editable=False
+    )
+    member_count = models.IntegerField(default=0)
+    pool_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    penalties_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    holdings_value = models.DecimalField(max_digits=24, decimal_places=4, default=0)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Group balance meta
+        """
+        verbose_name = "Group balance"
+        verbose_name_plural = "Group balance"
+
+    def __str__(self):
+        """
+        String representation of the group balance
+        """
+        return f"Group ledger v{self.version}"
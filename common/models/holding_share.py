@@ -3,6 +3,8 @@ HoldingShare model — member's units in an investment (immutable).
 """
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class HoldingShare(models.Model):
     """
@@ -22,6 +24,10 @@ class HoldingShare(models.Model):
     )
     units = models.DecimalField(max_digits=20, decimal_places=4)
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
+
+    reversal_record_type = ReversalRecordType.HOLDING_SHARE
+    objects = ReversibleQuerySet.as_manager()
 
     class Meta:
         """
@@ -30,6 +36,22 @@ class HoldingShare(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Holding share"
         verbose_name_plural = "Holding shares"
+        indexes = [
+            models.Index(
+                fields=["member", "investment"],
+                include=["units"],
+                condition=models.Q(is_reversed=False),
+                name="holdingshare_member_active_idx",
+            ),
+        ]
+        constraints = [
+            # One active share per member per investment (job retries are idempotent)
+            models.UniqueConstraint(
+                fields=["investment", "member"],
+                condition=models.Q(is_reversed=False),
+                name="holdingshare_active_uniq",
+            ),
+        ]
 
     def __str__(self):
         """
@@ -0,0 +1,121 @@
+"""
+InvestmentJob model — background (async) execution of record_investment.
+"""
+
+from django.conf import settings
+from django.db import models
+
+
+class InvestmentJobStatus(models.TextChoices):
+    """Status of an investment job."""
+
+    PENDING = "pending", "Pending"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+class InvestmentJob(models.Model):
+    """
+    Queued investment recording, allocated in member chunks by a DB-backed worker.
+    last_member_id is the keyset cursor: HoldingShare rows for members up to it
+    are committed together with the cursor, so a retry resumes after it.
+    eligible_total, allocated_units, the largest-remainder cutoff
+    (remainder_cutoff, cutoff_member_id) and each member's eligible savings
+    (InvestmentJobMember) are fixed when the job starts, so every chunk rounds
+    exactly as a single allocation over all members would, even if the ledger
+    changes while the job runs.
+    """
+
+    status = models.CharField(
+        max_length=16,
+        choices=InvestmentJobStatus.choices,
+        default=InvestmentJobStatus.PENDING,
+    )
+    recorded_at = models.DateField()
+    unit_value = models.DecimalField(max_digits=20, decimal_places=4)
+    total_units = models.DecimalField(
+        max_digits=20, decimal_places=4, null=True, blank=True
+    )
+    investment = models.OneToOneField(
+        "common.Investment",
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="job",
+    )
+    members_total = models.PositiveIntegerField(default=0)
+    members_processed = models.PositiveIntegerField(default=0)
+    last_member_id = models.UUIDField(null=True, blank=True)
+    eligible_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    allocated_units = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    remainder_cutoff = models.DecimalField(
+        max_digits=40, decimal_places=0, null=True, blank=True
+    )
+    cutoff_member_id = models.UUIDField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    class Meta:
+        """
+        Investment job meta
+        """
+        ordering = ["created_at"]
+        verbose_name = "Investment job"
+        verbose_name_plural = "Investment jobs"
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="investmentjob_open_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the investment job
+        """
+        return f"Investment job {self.pk} ({self.status})"
+
+
+class InvestmentJobMember(models.Model):
+    """
+    A member's eligible savings as of the job's recorded_at, snapshotted when
+    the job starts; chunks allocate from these rows in member_id order.
+    Deleted once the job completes (its HoldingShare rows are the record).
+    """
+
+    job = models.ForeignKey(
+        InvestmentJob, on_delete=models.CASCADE, related_name="members"
+    )
+    member = models.ForeignKey(
+        "common.Member", on_delete=models.PROTECT, related_name="+"
+    )
+    eligible_savings = models.DecimalField(max_digits=20, decimal_places=4)
+
+    class Meta:
+        """
+        Investment job member meta
+        """
+        verbose_name = "Investment job member"
+        verbose_name_plural = "Investment job members"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "member"], name="investmentjobmember_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the investment job member
+        """
+        return f"Investment job {self.job_id} member {self.member_id}"
@@ -0,0 +1,40 @@
+"""
+MemberBalance model — per-member read model of non-reversed ledger totals.
+"""
+from django.db import models
+
+
+class MemberBalance(models.Model):
+    """
+    Running totals of a member's non-reversed contributions and penalties.
+    Maintained in the same transaction as contribution, penalty and reversal
+    writes; never edited directly. eligible_savings = contributions - penalties.
+    version advances on any ledger write touching the member (ETag validator).
+    """
+
+    member = models.OneToOneField(
+        "common.Member",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="balance",
+    )
+    contributions_total = models.DecimalField(
+        max_digits=20, decimal_places=4, default=0
+    )
+    penalties_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    eligible_savings = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Member balance meta
+        """
+        verbose_name = "Member balance"
+        verbose_name_plural = "Member balances"
+
+    def __str__(self):
+        """
+        String representation of the member balance
+        """
+        return f"Balance {self.eligible_savings} for {self.member_id}"
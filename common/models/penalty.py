@@ -3,6 +3,8 @@ Penalty model — immutable record for late or out-of-bound participation (late
 """
 from django.db import models
 
+from .reversal import ReversalRecordType, ReversibleQuerySet
+
 
 class Penalty(models.Model):
     """
@@ -27,6 +29,10 @@ class Penalty(models.Model):
     )
     recorded_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
+    is_reversed = models.BooleanField(default=False, editable=False)
+
+    reversal_record_type = ReversalRecordType.PENALTY
+    objects = ReversibleQuerySet.as_manager()
 
     class Meta:
         """
@@ -35,6 +41,21 @@ class Penalty(models.Model):
         ordering = ["-recorded_at"]
         verbose_name = "Penalty"
         verbose_name_plural = "Penalties"
+        indexes = [
+            models.Index(
+                fields=["member", "recorded_at"],
+                include=["amount"],
+                condition=models.Q(is_reversed=False),
+                name="penalty_member_active_idx",
+            ),
+            # Group-wide "as of date" sums (eligible savings, checkpoints)
+            models.Index(
+                fields=["recorded_at"],
+                include=["member", "amount"],
+                condition=models.Q(is_reversed=False),
+                name="penalty_date_active_idx",
+            ),
+        ]
 
     def __str__(self):
         """
@@ -0,0 +1,45 @@
+"""
+PositionCheckpoint model — member's non-reversed ledger totals as of a date.
+"""
+from django.db import models
+
+
+class PositionCheckpoint(models.Model):
+    """
+    Member's non-reversed contribution and penalty totals for records dated on or
+    before as_of. Written periodically (e.g. at window close); kept correct by
+    adjusting on backdated writes and reversals. As-of positions read the nearest
+    checkpoint plus the ledger delta after it.
+    """
+
+    member = models.ForeignKey(
+        "common.Member",
+        on_delete=models.CASCADE,
+        related_name="position_checkpoints",
+    )
+    as_of = models.DateField()
+    contributions_total = models.DecimalField(
+        max_digits=20, decimal_places=4, default=0
+    )
+    penalties_total = models.DecimalField(max_digits=20, decimal_places=4, default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Position checkpoint meta
+        """
+        ordering = ["-as_of"]
+        verbose_name = "Position checkpoint"
+        verbose_name_plural = "Position checkpoints"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["member", "as_of"],
+                name="positioncheckpoint_member_as_of_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the position checkpoint
+        """
+        return f"Checkpoint {self.member_id} @ {self.as_of}"
@@ -44,9 +44,28 @@ class Reversal(models.Model):
         ordering = ["-created_at"]
         verbose_name = "Reversal"
         verbose_name_plural = "Reversals"
+        constraints = [
+            # A record is reversed at most once; also the index for target lookups
+            models.UniqueConstraint(
+                fields=["original_record_type", "original_record_id"],
+                name="reversal_unique_target",
+            ),
+        ]
 
     def __str__(self):
         """
         String representation of the reversal
         """
         return f"Reversal of {self.original_record_type}:{self.original_record_id}"
+
+
+class ReversibleQuerySet(models.QuerySet):
+    """
+    QuerySet for ledger records that can be corrected via Reversal.
+    Models using it declare reversal_record_type (a ReversalRecordType) and an
+    is_reversed flag, set in the same transaction as the Reversal row.
+    """
+
+    def active(self):
+        """Exclude reversed records; served by partial WHERE NOT is_reversed indexes."""
+        return self.filter(is_reversed=False)
@@ -0,0 +1,55 @@
+"""
+StatementSnapshot model — precomputed statement rows for a closed period.
+"""
+from django.db import models
+
+
+class StatementSnapshot(models.Model):
+    """
+    Member's statement rows (contributions, penalties, investments, buy_outs) dated
+    within a closed ContributionWindow's period [period_start, period_end].
+    Built once the window has closed; deleted when a reversal or backdated write
+    touches the member in that period. Exit requests change status, so they are
+    never snapshotted.
+    """
+
+    member = models.ForeignKey(
+        "common.Member",
+        on_delete=models.CASCADE,
+        related_name="statement_snapshots",
+    )
+    window = models.ForeignKey(
+        "common.ContributionWindow",
+        on_delete=models.CASCADE,
+        related_name="statement_snapshots",
+    )
+    period_start = models.DateField()
+    period_end = models.DateField()
+    sections = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        Statement snapshot meta
+        """
+        ordering = ["member", "period_start"]
+        verbose_name = "Statement snapshot"
+        verbose_name_plural = "Statement snapshots"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["member", "window"],
+                name="statementsnapshot_member_window_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["member", "period_start", "period_end"],
+                name="statementsnapshot_period_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """
+        String representation of the statement snapshot
+        """
+        return f"Statement {self.member_id} {self.period_start}..{self.period_end}"
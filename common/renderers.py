@@ -0,0 +1,67 @@
+"""
+Export renderers for statement downloads: NDJSON and CSV.
+Selected with ?format=ndjson|csv (or Accept); large exports are streamed by the
+view with the stream_* helpers, render() covers small bodies such as errors.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+class _Echo:
+    """File-like object whose write() returns the value (csv.writer -> stream)."""
+
+    def write(self, value):
+        return value
+
+
+def ndjson_line(row: dict) -> str:
+    """One JSON object per line."""
+    return json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def stream_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    """Yield NDJSON lines for rows."""
+    for row in rows:
+        yield ndjson_line(row)
+
+
+def stream_csv(rows: Iterable[dict], columns: Iterable[str]) -> Iterator[str]:
+    """Yield a CSV header then one line per row; missing columns are empty."""
+    writer = csv.DictWriter(_Echo(), fieldnames=list(columns), restval="")
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return "".join(stream_ndjson(rows)).encode(self.charset)
+
+
+class CSVRenderer(BaseRenderer):
+    """Comma-separated values; a dict renders as a one-row table."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        return "".join(stream_csv(rows, columns)).encode(self.charset)
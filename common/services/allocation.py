@@ -0,0 +1,112 @@
+"""
+Allocation engine — split an integer total of minor units across weights with
+largest-remainder rounding, so the parts always sum exactly to the total.
+
+All amounts in the ledger have 4 decimal places (MINOR_UNIT_PLACES); values are
+converted to integer minor units once, allocated with integer arithmetic and
+converted back. Ties between equal remainders go to the smaller key (the
+earlier position when no keys are given), so results are deterministic and an
+allocation can be applied slice by slice (see allocate_slice).
+"""
+
+from collections.abc import Sequence
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional
+
+# Decimal places of every amount, unit and percentage column
+MINOR_UNIT_PLACES = 4
+
+
+def to_minor_units(value, places: int = MINOR_UNIT_PLACES) -> int:
+    """Decimal value -> integer count of 10**-places units (half-up)."""
+    return int(
+        Decimal(value).scaleb(places).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+    )
+
+
+def from_minor_units(minor: int, places: int = MINOR_UNIT_PLACES) -> Decimal:
+    """Integer count of 10**-places units -> Decimal."""
+    return Decimal(minor).scaleb(-places)
+
+
+def _check(total: int, weight_sum: int) -> None:
+    if total < 0:
+        raise ValueError("Allocation total must be >= 0")
+    if weight_sum <= 0 and total > 0:
+        raise ValueError("Allocation weights must sum to a positive value")
+
+
+def _floor_shares(total: int, weights: Sequence[int]) -> tuple[list, list, int]:
+    """(floor shares, remainders, leftover units) of total over weights."""
+    if any(w < 0 for w in weights):
+        raise ValueError("Allocation weights must be >= 0")
+    weight_sum = sum(weights)
+    _check(total, weight_sum)
+    if total == 0:
+        return [0] * len(weights), [0] * len(weights), 0
+    pairs = [divmod(w * total, weight_sum) for w in weights]
+    floors = [share for share, _ in pairs]
+    remainders = [rem for _, rem in pairs]
+    return floors, remainders, total - sum(floors)
+
+
+def _extra_unit_positions(remainders: list, leftover: int) -> list[int]:
+    """Positions of the leftover largest remainders; ties go to earlier positions."""
+    # sort is stable with reverse=True, so equal remainders keep their order
+    ranked = sorted(range(len(remainders)), key=remainders.__getitem__, reverse=True)
+    return ranked[:leftover]
+
+
+def extra_unit_cutoff(
+    total: int, weights: Sequence[int], keys: Optional[Sequence[Any]] = None
+) -> Optional[tuple[int, Any]]:
+    """
+    Largest-remainder ranking of weights: (remainder, key) of the last weight
+    that receives one extra unit beyond its floor share, or None if the floor
+    shares already sum to total. keys must be ascending; they default to
+    positions.
+    """
+    _, remainders, leftover = _floor_shares(total, weights)
+    if leftover == 0:
+        return None
+    last = _extra_unit_positions(remainders, leftover)[-1]
+    return remainders[last], (keys[last] if keys is not None else last)
+
+
+def allocate_slice(
+    total: int,
+    weight_sum: int,
+    weights: Sequence[int],
+    keys: Sequence[Any],
+    cutoff: Optional[tuple[int, Any]],
+) -> list[int]:
+    """
+    Shares for a slice of a larger allocation: weight_sum and cutoff are those
+    of the whole (see extra_unit_cutoff), so slices computed independently add
+    up to exactly the same parts as allocate over all weights.
+    """
+    _check(total, weight_sum)
+    if total == 0:
+        return [0] * len(weights)
+    shares = []
+    for w, key in zip(weights, keys):
+        share, rem = divmod(w * total, weight_sum)
+        if cutoff is not None and (
+            rem > cutoff[0] or (rem == cutoff[0] and key <= cutoff[1])
+        ):
+            share += 1
+        shares.append(share)
+    return shares
+
+
+def allocate(total: int, weights: Sequence[int]) -> list[int]:
+    """
+    Split total (integer minor units) in proportion to weights (integers >= 0).
+    Each part is its floor share; the leftover units go one each to the largest
+    remainders. sum(result) == total whenever any weight is positive.
+    """
+    floors, remainders, leftover = _floor_shares(total, weights)
+    if leftover:
+        for i in _extra_unit_positions(remainders, leftover):
+            floors[i] += 1
+    return floors
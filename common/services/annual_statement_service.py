@@ -0,0 +1,117 @@
+"""
+AnnualStatementService — year-end statements for every member: ledger rows are
+prefetched in bulk per member chunk, files are rendered on a process pool.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Any, Optional
+
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from common.models import Member
+from common.services.statement_files import write_statement_file
+from common.services.statement_service import (
+    STATEMENT_COLUMNS,
+    STATEMENT_SECTIONS,
+    STREAM_CHUNK_SIZE,
+    get_section_querysets,
+    row_member_ids,
+)
+
+# Members whose ledger rows are prefetched (and held in memory) at a time
+MEMBER_CHUNK_SIZE = 1000
+
+FORMATS = ("json", "csv")
+
+
+def _chunk_statements(
+    member_ids: list, from_date: date, to_date: date
+) -> dict[Any, dict[str, Any]]:
+    """Statements for a chunk of members: one query per section for the chunk."""
+    statements = {
+        member_id: {
+            "from_date": from_date.isoformat(),
+            "to_date": to_date.isoformat(),
+            **{section: [] for section in STATEMENT_SECTIONS},
+        }
+        for member_id in member_ids
+    }
+    querysets = get_section_querysets(from_date, to_date)
+    for section, build_row in STATEMENT_SECTIONS.items():
+        queryset = querysets[section]
+        if section == "buy_outs":
+            queryset = queryset.filter(
+                Q(seller_id__in=member_ids) | Q(buyer_id__in=member_ids)
+            )
+        else:
+            queryset = queryset.filter(member_id__in=member_ids)
+        for obj in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            row = build_row(obj)
+            for member_id in row_member_ids(section, obj) & statements.keys():
+                statements[member_id][section].append(row)
+    return statements
+
+
+def generate_annual_statements(
+    year: int,
+    output_dir: str,
+    fmt: str = "json",
+    workers: Optional[int] = None,
+) -> dict[str, Any]:
+    """
+    Write statement-<member_id>.<fmt> for every member for the calendar year,
+    plus manifest.json (files, sizes, sha256, timing). Rows are read in bulk per
+    MEMBER_CHUNK_SIZE members; rendering and writing run on a process pool of
+    workers processes (default: CPU count). Returns the manifest.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    from_date, to_date = date(year, 1, 1), date(year, 12, 31)
+    os.makedirs(output_dir, exist_ok=True)
+    started = time.perf_counter()
+    entries: list[dict[str, Any]] = []
+
+    # Workers must not inherit open database connections (fork start method)
+    connections.close_all()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pool.submit(int).result()
+        member_ids = list(Member.objects.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(member_ids), MEMBER_CHUNK_SIZE):
+            chunk = member_ids[start : start + MEMBER_CHUNK_SIZE]
+            statements = _chunk_statements(chunk, from_date, to_date)
+            futures = [
+                (
+                    member_id,
+                    pool.submit(
+                        write_statement_file,
+                        os.path.join(output_dir, f"statement-{member_id}.{fmt}"),
+                        statement,
+                        fmt,
+                        list(STATEMENT_COLUMNS),
+                    ),
+                )
+                for member_id, statement in statements.items()
+            ]
+            for member_id, future in futures:
+                entries.append({"member_id": str(member_id), **future.result()})
+
+    elapsed = time.perf_counter() - started
+    manifest = {
+        "year": year,
+        "format": fmt,
+        "generated_at": timezone.now().isoformat(),
+        "member_count": len(entries),
+        "workers": workers or os.cpu_count(),
+        "elapsed_seconds": round(elapsed, 3),
+        "statements_per_second": round(len(entries) / elapsed, 1) if elapsed else None,
+        "files": entries,
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
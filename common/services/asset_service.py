@@ -7,42 +7,50 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
+from django.db import transaction
+from django.db.models import DecimalField, F, Sum
+
 from common.models import (
     Asset,
     AssetShare,
     HoldingShare,
     Investment,
-    Reversal,
 )
-from common.models.reversal import ReversalRecordType
+from common.services.allocation import allocate, from_minor_units, to_minor_units
+from common.services.ledger_service import bump_ledger_versions, lock_ledger
 
+# AssetShare.share_percentage of the whole asset
+FULL_SHARE_PERCENTAGE = Decimal("100")
 
-def _reversed_holding_share_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.HOLDING_SHARE
-        ).values_list("original_record_id", flat=True)
-    )
+# Rows per INSERT when creating asset shares
+ASSET_SHARE_BATCH_SIZE = 1000
+
+# Decimal places of units * unit_value (4 + 4)
+HOLDING_VALUE_PLACES = 8
 
 
 def _holding_value_per_member_as_of(as_of_date):
     """
     Per member: sum of (HoldingShare.units * Investment.unit_value) for non-reversed
     holding shares where investment.recorded_at <= as_of_date.
-    Returns dict member_id -> Decimal.
+    One grouped query; returns dict member_id -> Decimal, ordered by member_id.
     """
-    rev_hs = _reversed_holding_share_ids()
-    # HoldingShare with investment.recorded_at <= as_of_date, exclude reversed
-    qs = (
-        HoldingShare.objects.filter(investment__recorded_at__lte=as_of_date)
-        .exclude(id__in=rev_hs)
-        .select_related("investment")
+    rows = (
+        HoldingShare.objects.active()
+        .filter(investment__recorded_at__lte=as_of_date)
+        .values("member_id")
+        .annotate(
+            value=Sum(
+                F("units") * F("investment__unit_value"),
+                output_field=DecimalField(
+                    max_digits=40, decimal_places=HOLDING_VALUE_PLACES
+                ),
+            )
+        )
+        .order_by("member_id")
+        .values_list("member_id", "value")
     )
-    result = {}
-    for hs in qs:
-        value = hs.units * hs.investment.unit_value
-        result[hs.member_id] = result.get(hs.member_id, Decimal("0")) + value
-    return result
+    return dict(rows)
 
 
 def record_asset(
@@ -55,7 +63,9 @@ def record_asset(
     """
     Record asset conversion. Create Asset and AssetShare rows; ownership proportional
     to holdings at conversion (non-reversed HoldingShare value per member).
-    Sum of share_percentage per asset = 100.
+    Percentages are allocated by largest remainder, so their sum per asset is
+    exactly 100. The asset and its shares are written in one transaction with
+    batched inserts.
     """
     if isinstance(conversion_at, str):
         conversion_at = datetime.fromisoformat(
@@ -71,34 +81,48 @@ def record_asset(
     total_value = sum(holding_values.values())
     if total_value <= 0:
         # No holdings at conversion: create asset with no shares (or skip)
-        asset = Asset.objects.create(
-            name=name,
-            recorded_purchase_value=recorded_purchase_value,
-            conversion_at=conversion_at,
-            source_investment_id=source_investment_id,
-            created_by=created_by,
-        )
+        with transaction.atomic():
+            lock_ledger()
+            asset = Asset.objects.create(
+                name=name,
+                recorded_purchase_value=recorded_purchase_value,
+                conversion_at=conversion_at,
+                source_investment_id=source_investment_id,
+                created_by=created_by,
+            )
+            bump_ledger_versions()
         return asset
 
     source_investment = None
     if source_investment_id is not None:
         source_investment = Investment.objects.filter(pk=source_investment_id).first()
 
-    asset = Asset.objects.create(
-        name=name,
-        recorded_purchase_value=recorded_purchase_value,
-        conversion_at=conversion_at,
-        source_investment=source_investment,
-        created_by=created_by,
+    holders = [
+        (member_id, value) for member_id, value in holding_values.items() if value > 0
+    ]
+    percentages = allocate(
+        to_minor_units(FULL_SHARE_PERCENTAGE),
+        [to_minor_units(value, HOLDING_VALUE_PLACES) for _, value in holders],
     )
-
-    for member_id, value in holding_values.items():
-        if value <= 0:
-            continue
-        share_pct = (value / total_value) * Decimal("100")
-        AssetShare.objects.create(
-            asset=asset,
-            member_id=member_id,
-            share_percentage=share_pct,
+    with transaction.atomic():
+        lock_ledger()
+        asset = Asset.objects.create(
+            name=name,
+            recorded_purchase_value=recorded_purchase_value,
+            conversion_at=conversion_at,
+            source_investment=source_investment,
+            created_by=created_by,
+        )
+        AssetShare.objects.bulk_create(
+            [
+                AssetShare(
+                    asset=asset,
+                    member_id=member_id,
+                    share_percentage=from_minor_units(share_pct),
+                )
+                for (member_id, _), share_pct in zip(holders, percentages)
+            ],
+            batch_size=ASSET_SHARE_BATCH_SIZE,
         )
+        bump_ledger_versions(member_id for member_id, _ in holders)
     return asset
@@ -6,7 +6,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+from django.db import transaction
+
 from common.models import BuyOut, Member
+from common.services.ledger_service import lock_ledger, on_buyout_recorded
 
 
 def record_buyout(
@@ -27,11 +30,15 @@ def record_buyout(
         buyer = Member.objects.get(pk=buyer_id)
     rec_at = recorded_at or datetime.now()
     inputs = valuation_inputs if valuation_inputs is not None else {}
-    return BuyOut.objects.create(
-        seller=seller,
-        buyer=buyer,
-        nominal_valuation=nominal_valuation,
-        valuation_inputs=inputs,
-        recorded_at=rec_at,
-        created_by=created_by,
-    )
+    with transaction.atomic():
+        lock_ledger()
+        buyout = BuyOut.objects.create(
+            seller=seller,
+            buyer=buyer,
+            nominal_valuation=nominal_valuation,
+            valuation_inputs=inputs,
+            recorded_at=rec_at,
+            created_by=created_by,
+        )
+        on_buyout_recorded(buyout)
+    return buyout
@@ -0,0 +1,74 @@
+"""
+CheckpointService — write per-member PositionCheckpoint rows (non-reversed
+contribution and penalty totals as of a date) for as-of position reads.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from common.models import (
+    Contribution,
+    ContributionWindow,
+    Member,
+    Penalty,
+    PositionCheckpoint,
+)
+from common.services.ledger_service import date_range_q, ledger_date, lock_ledger
+
+
+def default_checkpoint_date() -> date:
+    """End date of the latest closed contribution window, else yesterday."""
+    now = timezone.now()
+    window = (
+        ContributionWindow.objects.filter(end_at__lte=now).order_by("-end_at").first()
+    )
+    if window is not None:
+        return ledger_date(window.end_at)
+    return timezone.localdate(now) - timedelta(days=1)
+
+
+def create_position_checkpoints(as_of: Optional[date] = None) -> int:
+    """
+    Write (or overwrite) a checkpoint as of the given date for every member,
+    from one grouped sum per ledger table. Built under lock_ledger, like the
+    writers that adjust checkpoints, so no write can commit between the sums
+    and the insert. Returns the number of rows written.
+    """
+    if as_of is None:
+        as_of = default_checkpoint_date()
+    with transaction.atomic():
+        lock_ledger()
+        contributions = _totals_by_member(Contribution, as_of)
+        penalties = _totals_by_member(Penalty, as_of)
+        checkpoints = [
+            PositionCheckpoint(
+                member_id=member_id,
+                as_of=as_of,
+                contributions_total=contributions.get(member_id, Decimal("0")),
+                penalties_total=penalties.get(member_id, Decimal("0")),
+            )
+            for member_id in Member.objects.values_list("pk", flat=True)
+        ]
+        PositionCheckpoint.objects.bulk_create(
+            checkpoints,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["member", "as_of"],
+            update_fields=["contributions_total", "penalties_total"],
+        )
+    return len(checkpoints)
+
+
+def _totals_by_member(model, as_of: date) -> dict:
+    return dict(
+        model.objects.active()
+        .filter(date_range_q("recorded_at", to_date=as_of))
+        .values("member_id")
+        .annotate(total=Sum("amount"))
+        .values_list("member_id", "total")
+    )
@@ -5,28 +5,15 @@ ContributionRecordingService — record_contribution, record_penalty; validate w
 from decimal import Decimal
 from typing import Optional
 
+from django.db import transaction
 from django.utils import timezone
 
-from common.models import Contribution, ContributionWindow, Member, Penalty, Reversal
-from common.models.reversal import ReversalRecordType
-
-
-def _reversed_contribution_ids():
-    """Set of contribution IDs that have been reversed."""
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.CONTRIBUTION
-        ).values_list("original_record_id", flat=True)
-    )
-
-
-def _reversed_penalty_ids():
-    """Set of penalty IDs that have been reversed."""
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.PENALTY
-        ).values_list("original_record_id", flat=True)
-    )
+from common.models import Contribution, ContributionWindow, Member, Penalty
+from common.services.ledger_service import (
+    lock_ledger,
+    on_contribution_recorded,
+    on_penalty_recorded,
+)
 
 
 def record_contribution(
@@ -38,6 +25,7 @@ def record_contribution(
 ) -> Contribution:
     """
     Record a contribution. Validates window exists and optional min/max amount.
+    Member balance is updated in the same transaction.
     """
     window = ContributionWindow.objects.get(pk=window_id)
     member = Member.objects.get(pk=member_id)
@@ -50,12 +38,16 @@ def record_contribution(
         raise ValueError(f"Amount below window min_amount {window.min_amount}")
     if window.max_amount is not None and amount > window.max_amount:
         raise ValueError(f"Amount above window max_amount {window.max_amount}")
-    return Contribution.objects.create(
-        member=member,
-        window=window,
-        amount=amount,
-        recorded_at=recorded_at,
-    )
+    with transaction.atomic():
+        lock_ledger()
+        contribution = Contribution.objects.create(
+            member=member,
+            window=window,
+            amount=amount,
+            recorded_at=recorded_at,
+        )
+        on_contribution_recorded(contribution)
+    return contribution
 
 
 def record_penalty(
@@ -66,7 +58,7 @@ def record_penalty(
     recorded_at=None,
     created_by=None,
 ) -> Penalty:
-    """Record a penalty (late fee)."""
+    """Record a penalty (late fee); member balance updated in the same transaction."""
     member = Member.objects.get(pk=member_id)
     if recorded_at is None:
         recorded_at = timezone.now()
@@ -76,10 +68,14 @@ def record_penalty(
     window = None
     if window_id is not None:
         window = ContributionWindow.objects.get(pk=window_id)
-    return Penalty.objects.create(
-        member=member,
-        amount=amount,
-        reason=reason or "",
-        window=window,
-        recorded_at=recorded_at,
-    )
+    with transaction.atomic():
+        lock_ledger()
+        penalty = Penalty.objects.create(
+            member=member,
+            amount=amount,
+            reason=reason or "",
+            window=window,
+            recorded_at=recorded_at,
+        )
+        on_penalty_recorded(penalty)
+    return penalty
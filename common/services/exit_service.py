@@ -1,63 +1,64 @@
 """
-ExitRequestService — create exit request (FIFO queue), optional fulfill.
-Excludes reversed exit requests when assigning queue position.
+ExitRequestService — create exit request (FIFO queue), cancel, optional fulfill.
+Queue positions come from the locked ExitQueue counter row.
 """
 
-from decimal import Decimal
+import base64
+import json
+from decimal import ROUND_DOWN, Decimal
 from typing import Optional
 
-from django.db.models import Max, Sum
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 
-from common.models import Contribution, ExitRequest, Member, Penalty, Reversal
+from common.models import ExitQueue, ExitRequest, Member
+from common.models.exit_queue import EXIT_QUEUE_ID
 from common.models.exit_request import ExitRequestStatus
-from common.models.reversal import ReversalRecordType
+from common.services.allocation import MINOR_UNIT_PLACES
+from common.services.ledger_service import (
+    bump_exit_queue_version,
+    bump_ledger_versions,
+    get_exit_queue_version,
+    get_member_balance,
+    lock_ledger,
+)
 
+# Queued requests locked per round trip during batch fulfilment
+EXIT_FULFILMENT_BATCH_SIZE = 500
 
-def _reversed_contribution_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.CONTRIBUTION
-        ).values_list("original_record_id", flat=True)
-    )
-
-
-def _reversed_penalty_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.PENALTY
-        ).values_list("original_record_id", flat=True)
-    )
-
+# Default and largest exit queue listing page
+EXIT_PAGE_SIZE = 100
+MAX_EXIT_PAGE_SIZE = 500
 
-def _reversed_exit_request_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.EXIT_REQUEST
-        ).values_list("original_record_id", flat=True)
-    )
+# Seconds a queue rank map is kept; keys change with the queue version anyway
+EXIT_RANK_CACHE_TIMEOUT = 3600
 
 
 def _member_entitlement(member: Member) -> Decimal:
     """
     Nominal entitlement for exit: contributions (non-reversed) minus penalties (non-reversed).
     Policy: return of contributions; penalties reduce entitlement.
+    Read from the MemberBalance projection.
     """
-    rev_contrib = _reversed_contribution_ids()
-    rev_penalty = _reversed_penalty_ids()
-    contrib_total = (
-        Contribution.objects.filter(member=member)
-        .exclude(id__in=rev_contrib)
-        .aggregate(total=Sum("amount"))["total"]
-        or Decimal("0")
-    )
-    penalty_total = (
-        Penalty.objects.filter(member=member)
-        .exclude(id__in=rev_penalty)
-        .aggregate(total=Sum("amount"))["total"]
-        or Decimal("0")
-    )
-    return max(Decimal("0"), contrib_total - penalty_total)
+    return max(Decimal("0"), get_member_balance(member).eligible_savings)
+
+
+def next_queue_position() -> int:
+    """
+    Take the next exit queue position. Must run inside the transaction that
+    uses it: the ExitQueue row stays locked until commit, so concurrent callers
+    (any process or node) wait for it and never get the same position, and a
+    rollback returns the position.
+    """
+    queue, _ = ExitQueue.objects.select_for_update().get_or_create(pk=EXIT_QUEUE_ID)
+    position = queue.next_position
+    queue.next_position += 1
+    queue.version += 1
+    queue.save(update_fields=["next_position", "version", "updated_at"])
+    return position
 
 
 def create_exit_request(member_id: int) -> ExitRequest:
@@ -66,20 +67,17 @@ def create_exit_request(member_id: int) -> ExitRequest:
     amount_entitled set from contributions - penalties (policy: return of savings).
     """
     member = Member.objects.get(pk=member_id)
-    rev = _reversed_exit_request_ids()
-    next_pos = (
-        ExitRequest.objects.filter(status=ExitRequestStatus.QUEUED)
-        .exclude(id__in=rev)
-        .aggregate(m=Max("queue_position"))["m"]
-    )
-    queue_position = (next_pos or 0) + 1
     amount_entitled = _member_entitlement(member)
-    return ExitRequest.objects.create(
-        member=member,
-        queue_position=queue_position,
-        status=ExitRequestStatus.QUEUED,
-        amount_entitled=amount_entitled,
-    )
+    with transaction.atomic():
+        lock_ledger()
+        req = ExitRequest.objects.create(
+            member=member,
+            queue_position=next_queue_position(),
+            status=ExitRequestStatus.QUEUED,
+            amount_entitled=amount_entitled,
+        )
+        bump_ledger_versions([member.pk])
+    return req
 
 
 def fulfill_exit_request(
@@ -96,5 +94,177 @@ def fulfill_exit_request(
     req.fulfilled_at = timezone.now()
     if amount_entitled is not None:
         req.amount_entitled = amount_entitled
-    req.save(update_fields=["status", "fulfilled_at", "amount_entitled"])
+    with transaction.atomic():
+        lock_ledger()
+        req.save(update_fields=["status", "fulfilled_at", "amount_entitled"])
+        # ExitQueue before member/group balances, as in create_exit_request
+        bump_exit_queue_version()
+        bump_ledger_versions([req.member_id])
+    return req
+
+
+def cancel_exit_request(exit_request_id: int) -> ExitRequest:
+    """
+    Cancel a queued exit request: it leaves the queue (later requests move up
+    a rank) and the queue and member versions advance, so cached ranks and
+    position ETags do not outlive the change.
+    """
+    with transaction.atomic():
+        lock_ledger()
+        ExitQueue.objects.select_for_update().get_or_create(pk=EXIT_QUEUE_ID)
+        req = ExitRequest.objects.select_for_update().get(pk=exit_request_id)
+        if req.status != ExitRequestStatus.QUEUED or req.is_reversed:
+            raise ValueError(f"Exit request {exit_request_id} is not queued")
+        req.status = ExitRequestStatus.CANCELLED
+        req.save(update_fields=["status"])
+        bump_exit_queue_version()
+        bump_ledger_versions([req.member_id])
     return req
+
+
+def fulfill_exit_queue(
+    liquidity, batch_size: int = EXIT_FULFILMENT_BATCH_SIZE
+) -> dict:
+    """
+    Pay out the queue first-come-first-served with the given liquidity, in one
+    transaction: queued requests are locked in queue_position order (FOR UPDATE
+    SKIP LOCKED, batch_size at a time) and fulfilled while their
+    amount_entitled fits; the first request that does not fit stops the run,
+    so nobody is paid ahead of an earlier request.
+    Returns liquidity, paid_total, remaining_liquidity, fulfilled (requests)
+    and still_queued (count and amount_entitled total).
+    """
+    # str() first: a float converts to its shortest repr (0.3, not 0.2999...)
+    liquidity = Decimal(str(liquidity))
+    if not liquidity.is_finite():
+        raise ValueError("liquidity must be a finite number")
+    if liquidity < 0:
+        raise ValueError("liquidity must be >= 0")
+    # Never pay out a fraction of a minor unit that is not there
+    liquidity = liquidity.quantize(
+        Decimal(1).scaleb(-MINOR_UNIT_PLACES), rounding=ROUND_DOWN
+    )
+    remaining = liquidity
+    fulfilled = []
+    queued = (
+        ExitRequest.objects.active()
+        .filter(status=ExitRequestStatus.QUEUED)
+        .select_for_update(skip_locked=True)
+        .order_by("queue_position")
+    )
+    with transaction.atomic():
+        lock_ledger()
+        last_position = None
+        exhausted = False
+        while not exhausted:
+            batch = queued
+            if last_position is not None:
+                batch = batch.filter(queue_position__gt=last_position)
+            batch = list(batch[:batch_size])
+            if not batch:
+                break
+            for req in batch:
+                if req.amount_entitled > remaining:
+                    exhausted = True
+                    break
+                remaining -= req.amount_entitled
+                fulfilled.append(req)
+            last_position = batch[-1].queue_position
+
+        now = timezone.now()
+        ExitRequest.objects.filter(pk__in=[req.pk for req in fulfilled]).update(
+            status=ExitRequestStatus.FULFILLED, fulfilled_at=now
+        )
+        for req in fulfilled:
+            req.status = ExitRequestStatus.FULFILLED
+            req.fulfilled_at = now
+        if fulfilled:
+            bump_exit_queue_version()
+            bump_ledger_versions({req.member_id for req in fulfilled})
+        still_queued = (
+            ExitRequest.objects.active()
+            .filter(status=ExitRequestStatus.QUEUED)
+            .aggregate(count=Count("id"), amount_total=Sum("amount_entitled"))
+        )
+    return {
+        "liquidity": liquidity,
+        "paid_total": liquidity - remaining,
+        "remaining_liquidity": remaining,
+        "fulfilled": fulfilled,
+        "still_queued": {
+            "count": still_queued["count"],
+            "amount_total": still_queued["amount_total"] or Decimal("0"),
+        },
+    }
+
+
+def get_exit_queue_ranks() -> dict:
+    """
+    Live rank (1 = next to be paid) of every active queued request, as
+    exit_request_id -> rank: ROW_NUMBER() OVER (ORDER BY queue_position, id),
+    answered from the partial index on queued rows. Cached per queue version,
+    so positions freed by fulfilments and cancellations are never shown.
+    """
+    key = f"exit-queue-ranks-{get_exit_queue_version()}"
+    ranks = cache.get(key)
+    if ranks is None:
+        ranks = dict(
+            ExitRequest.objects.active()
+            .filter(status=ExitRequestStatus.QUEUED)
+            .annotate(
+                rank=Window(RowNumber(), order_by=[F("queue_position"), F("id")])
+            )
+            .values_list("id", "rank")
+        )
+        cache.set(key, ranks, EXIT_RANK_CACHE_TIMEOUT)
+    return ranks
+
+
+def encode_exit_cursor(queue_position: int, pk: int) -> str:
+    """Opaque cursor for the exit request after (queue_position, pk)."""
+    payload = json.dumps({"p": queue_position, "id": pk})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_exit_cursor(cursor: str) -> tuple[int, int]:
+    """Return (queue_position, pk) from a cursor; raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(payload["p"]), int(payload["id"])
+    except (TypeError, KeyError, AttributeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def list_exit_requests(
+    status: Optional[str] = None,
+    member_id=None,
+    limit: int = EXIT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+) -> tuple[list, Optional[str]]:
+    """
+    Exit requests ordered by (queue_position, id), optionally filtered by status
+    and member; keyset page of up to limit rows after cursor.
+    status=queued lists the live queue (non-reversed) from the partial index on
+    queued rows. Returns (requests, next cursor or None on the last page).
+    """
+    if status is not None and status not in ExitRequestStatus.values:
+        raise ValueError(f"Unknown status {status!r}")
+    qs = ExitRequest.objects.all()
+    if status == ExitRequestStatus.QUEUED:
+        qs = qs.active()
+    if status is not None:
+        qs = qs.filter(status=status)
+    if member_id is not None:
+        qs = qs.filter(member_id=member_id)
+    if cursor is not None:
+        position, pk = decode_exit_cursor(cursor)
+        qs = qs.filter(
+            Q(queue_position__gte=position),
+            Q(queue_position__gt=position) | Q(pk__gt=pk),
+        )
+    rows = list(qs.order_by("queue_position", "id")[: limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_exit_cursor(rows[-1].queue_position, rows[-1].pk)
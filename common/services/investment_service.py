@@ -3,73 +3,71 @@ InvestmentRecordingService — record_investment: compute member shares
     from eligible savings, create HoldingShare rows.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
 
-from django.db.models import Sum
+from django.db import transaction
+from django.utils import timezone
 
 from common.models import (
-    Contribution,
     HoldingShare,
     Investment,
-    Penalty,
-    Reversal,
+    InvestmentJob,
+    InvestmentJobMember,
+    InvestmentJobStatus,
+)
+from common.services.allocation import (
+    allocate,
+    allocate_slice,
+    extra_unit_cutoff,
+    from_minor_units,
+    to_minor_units,
+)
+from common.services.ledger_service import (
+    bump_ledger_versions,
+    eligible_savings_rows,
+    lock_ledger,
+    on_holdings_recorded,
 )
-from common.models.reversal import ReversalRecordType
 
+# Rows per INSERT when creating holding shares
+HOLDING_SHARE_BATCH_SIZE = 1000
 
-def _reversed_contribution_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.CONTRIBUTION
-        ).values_list("original_record_id", flat=True)
-    )
+# Members allocated per committed step of an investment job
+INVESTMENT_JOB_CHUNK_SIZE = 1000
 
+OPEN_JOB_STATUSES = (InvestmentJobStatus.PENDING, InvestmentJobStatus.RUNNING)
 
-def _reversed_penalty_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.PENALTY
-        ).values_list("original_record_id", flat=True)
-    )
+MAX_PREVIEW_UNIT_VALUES = 20
 
 
-def _eligible_savings_per_member_as_of(as_of_date):
-    """
-    Per member: sum of non-reversed contributions with recorded_at <= as_of_date
-    minus sum of non-reversed penalties with recorded_at <= as_of_date.
-    Returns dict member_id -> Decimal.
-    """
-    rev_contrib = _reversed_contribution_ids()
-    rev_penalty = _reversed_penalty_ids()
+def _investment_input(recorded_at, unit_value) -> tuple[date, Decimal]:
+    """Normalize recorded_at to a date and validate unit_value."""
+    if isinstance(recorded_at, str):
+        recorded_at = datetime.fromisoformat(recorded_at.replace("Z", "+00:00")).date()
+    elif hasattr(recorded_at, "date"):
+        recorded_at = recorded_at.date()
+    unit_value = Decimal(unit_value)
+    if not unit_value.is_finite() or unit_value <= 0:
+        raise ValueError("Unit value must be positive")
+    return recorded_at, unit_value
 
-    # Contributions: exclude reversed, filter by recorded_at <= as_of_date
-    contrib_qs = Contribution.objects.filter(recorded_at__date__lte=as_of_date).exclude(
-        id__in=rev_contrib
-    )
-    contrib_by_member = dict(
-        contrib_qs.values("member_id")
-        .annotate(total=Sum("amount"))
-        .values_list("member_id", "total")
-    )
 
-    penalty_qs = Penalty.objects.filter(recorded_at__date__lte=as_of_date).exclude(
-        id__in=rev_penalty
-    )
-    penalty_by_member = dict(
-        penalty_qs.values("member_id")
-        .annotate(total=Sum("amount"))
-        .values_list("member_id", "total")
-    )
+def _allocated_units(eligible_total: Decimal, unit_value: Decimal) -> int:
+    """Units bought by the whole pool, in minor units (eligible_total / unit_value)."""
+    return to_minor_units(eligible_total / unit_value)
 
-    members = set(contrib_by_member) | set(penalty_by_member)
-    result = {}
-    for m_id in members:
-        c = contrib_by_member.get(m_id) or Decimal("0")
-        p = penalty_by_member.get(m_id) or Decimal("0")
-        result[m_id] = c - p
-    return result
+
+def _allocate_units(rows: list, unit_value: Decimal) -> tuple[int, list[int]]:
+    """
+    (total units, units per row) in minor units for (member_id, eligible savings)
+    rows with positive savings: the pool's units split by largest remainder, so
+    member units sum exactly to the investment's total.
+    """
+    weights = [to_minor_units(amount) for _, amount in rows]
+    total = _allocated_units(sum(amount for _, amount in rows), unit_value)
+    return total, allocate(total, weights)
 
 
 def record_investment(
@@ -81,42 +79,254 @@ def record_investment(
     """
     Record investment at date and unit value. Compute each member's eligible savings
     as of that date (contributions - penalties, excluding reversed); create HoldingShare
-    rows with units = eligible_savings / unit_value.
+    rows with units = eligible_savings / unit_value, rounded by largest remainder
+    so they sum exactly to the pool's units.
+    The investment and all its holding shares are written in one transaction
+    with batched inserts, so round trips do not grow per member.
     """
-    if isinstance(recorded_at, str):
-        recorded_at = datetime.fromisoformat(recorded_at.replace("Z", "+00:00")).date()
-    elif hasattr(recorded_at, "date"):
-        recorded_at = recorded_at.date()
-    unit_value = Decimal(unit_value)
-    if unit_value <= 0:
-        raise ValueError("Unit value must be positive")
-
-    eligible = _eligible_savings_per_member_as_of(recorded_at)
-    total_pool = sum(eligible.values())
-    if total_pool <= 0:
-        # No eligible savings: create investment with no holding shares
+    recorded_at, unit_value = _investment_input(recorded_at, unit_value)
+    with transaction.atomic():
+        # Savings are read under the ledger lock, so no write lands in between
+        lock_ledger()
+        rows = [
+            (member_id, amount)
+            for member_id, amount in eligible_savings_rows(recorded_at)
+            if amount > 0
+        ]
+        # No eligible savings: the investment gets no holding shares
+        allocated, units = _allocate_units(rows, unit_value)
         inv = Investment.objects.create(
             recorded_at=recorded_at,
             unit_value=unit_value,
-            total_units=total_units or Decimal("0"),
+            total_units=total_units or from_minor_units(allocated),
             created_by=created_by,
         )
-        return inv
+        HoldingShare.objects.bulk_create(
+            [
+                HoldingShare(
+                    investment=inv,
+                    member_id=member_id,
+                    units=from_minor_units(member_units),
+                )
+                for (member_id, _), member_units in zip(rows, units)
+            ],
+            batch_size=HOLDING_SHARE_BATCH_SIZE,
+        )
+        on_holdings_recorded(inv)
+    return inv
+
+
+def preview_investment(recorded_at, unit_values: list) -> dict:
+    """
+    Dry run of record_investment for several candidate unit values; no writes.
+    Eligible savings are read once (as of recorded_at); every candidate is then
+    evaluated against the same member list. Units are allocated exactly as
+    record_investment would. Returns recorded_at, eligible_total, member_count,
+    scenarios (unit_value, total_units per candidate) and members
+    (eligible_savings and one units entry per candidate, in scenario order).
+    """
+    if not unit_values:
+        raise ValueError("unit_values must not be empty")
+    if len(unit_values) > MAX_PREVIEW_UNIT_VALUES:
+        raise ValueError(
+            f"At most {MAX_PREVIEW_UNIT_VALUES} unit_values can be previewed"
+        )
+    candidates = []
+    for unit_value in unit_values:
+        recorded_at, unit_value = _investment_input(recorded_at, unit_value)
+        candidates.append(unit_value)
 
-    inv = Investment.objects.create(
+    # Read under the ledger lock, as record_investment does
+    with transaction.atomic():
+        lock_ledger()
+        eligible = [
+            (member_id, amount)
+            for member_id, amount in eligible_savings_rows(recorded_at)
+            if amount > 0
+        ]
+    allocations = [_allocate_units(eligible, unit_value) for unit_value in candidates]
+    totals = [from_minor_units(total) for total, _ in allocations]
+    members = [
+        {
+            "member_id": str(member_id),
+            "eligible_savings": str(amount),
+            "units": [str(from_minor_units(units[i])) for _, units in allocations],
+        }
+        for i, (member_id, amount) in enumerate(eligible)
+    ]
+    return {
+        "recorded_at": recorded_at.isoformat(),
+        "eligible_total": str(sum((amount for _, amount in eligible), Decimal("0"))),
+        "member_count": len(members),
+        "scenarios": [
+            {"unit_value": str(unit_value), "total_units": str(total)}
+            for unit_value, total in zip(candidates, totals)
+        ],
+        "members": members,
+    }
+
+
+def create_investment_job(
+    recorded_at,
+    unit_value: Decimal,
+    total_units: Optional[Decimal] = None,
+    created_by=None,
+) -> InvestmentJob:
+    """
+    Queue record_investment for the background worker (run_investment_jobs).
+    Input is validated now; allocation happens in chunks via run_investment_job.
+    """
+    recorded_at, unit_value = _investment_input(recorded_at, unit_value)
+    return InvestmentJob.objects.create(
         recorded_at=recorded_at,
         unit_value=unit_value,
-        total_units=total_units or (total_pool / unit_value),
+        total_units=total_units,
         created_by=created_by,
     )
 
-    for member_id, amount in eligible.items():
-        if amount <= 0:
-            continue
-        units = amount / unit_value
-        HoldingShare.objects.create(
-            investment=inv,
-            member_id=member_id,
-            units=units,
+
+def run_investment_job(
+    job_id: int, chunk_size: int = INVESTMENT_JOB_CHUNK_SIZE
+) -> Optional[InvestmentJob]:
+    """
+    Run or resume an open job until it completes. Each step locks the job row
+    (skipped if another worker holds it) and commits one chunk of HoldingShare
+    rows, with their projection updates and member versions, together with the
+    advanced member cursor, so a crash loses at most the uncommitted step and a
+    retry continues after the cursor. On error the job is marked failed;
+    retry_investment_job reopens it.
+    Returns the job, or None if it is not open or is locked by another worker.
+    """
+    worked = False
+    try:
+        while True:
+            more = _run_investment_job_step(job_id, chunk_size)
+            if more is None:
+                break
+            worked = True
+            if not more:
+                break
+    except Exception as e:
+        InvestmentJob.objects.filter(pk=job_id, status__in=OPEN_JOB_STATUSES).update(
+            status=InvestmentJobStatus.FAILED, error=str(e), updated_at=timezone.now()
         )
-    return inv
+        raise
+    return InvestmentJob.objects.get(pk=job_id) if worked else None
+
+
+def retry_investment_job(job: InvestmentJob) -> InvestmentJob:
+    """Reopen a failed job; the next run resumes after its member cursor."""
+    if job.status == InvestmentJobStatus.FAILED:
+        job.status = (
+            InvestmentJobStatus.RUNNING
+            if job.investment_id
+            else InvestmentJobStatus.PENDING
+        )
+        job.error = ""
+        job.save(update_fields=["status", "error", "updated_at"])
+    return job
+
+
+def _run_investment_job_step(job_id: int, chunk_size: int) -> Optional[bool]:
+    """
+    One committed step of a job: True while more work remains, False once the
+    job completed, None if the job is not open or is locked by another worker.
+    """
+    with transaction.atomic():
+        job = (
+            InvestmentJob.objects.select_for_update(skip_locked=True)
+            .filter(pk=job_id, status__in=OPEN_JOB_STATUSES)
+            .first()
+        )
+        if job is None:
+            return None
+        if job.investment_id is None:
+            _start_investment_job(job)
+            return job.status != InvestmentJobStatus.COMPLETED
+
+        rows = job.members.order_by("member_id").values_list(
+            "member_id", "eligible_savings"
+        )
+        if job.last_member_id is not None:
+            rows = rows.filter(member_id__gt=job.last_member_id)
+        rows = list(rows[:chunk_size])
+        if not rows:
+            job.members.all().delete()
+            job.status = InvestmentJobStatus.COMPLETED
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "finished_at", "updated_at"])
+            return False
+
+        cutoff = None
+        if job.remainder_cutoff is not None:
+            cutoff = (int(job.remainder_cutoff), job.cutoff_member_id)
+        units = allocate_slice(
+            to_minor_units(job.allocated_units),
+            to_minor_units(job.eligible_total),
+            [to_minor_units(amount) for _, amount in rows],
+            [member_id for member_id, _ in rows],
+            cutoff,
+        )
+        shares = [
+            HoldingShare(
+                investment_id=job.investment_id,
+                member_id=member_id,
+                units=from_minor_units(member_units),
+            )
+            for (member_id, _), member_units in zip(rows, units)
+        ]
+        lock_ledger()
+        HoldingShare.objects.bulk_create(
+            shares, batch_size=HOLDING_SHARE_BATCH_SIZE, ignore_conflicts=True
+        )
+        on_holdings_recorded(job.investment, [member_id for member_id, _ in rows])
+        job.last_member_id = rows[-1][0]
+        job.members_processed += len(shares)
+        job.save(update_fields=["last_member_id", "members_processed", "updated_at"])
+        return True
+
+
+def _start_investment_job(job: InvestmentJob) -> None:
+    """
+    Create the Investment and fix the allocation from all eligible savings:
+    per-member savings (InvestmentJobMember), pool total, units to allocate and
+    the largest-remainder cutoff. Later ledger writes do not change the job.
+    """
+    lock_ledger()
+    rows = [
+        (member_id, amount)
+        for member_id, amount in eligible_savings_rows(job.recorded_at)
+        if amount > 0
+    ]
+    total_pool = sum((amount for _, amount in rows), Decimal("0"))
+    allocated = _allocated_units(total_pool, job.unit_value)
+    cutoff = extra_unit_cutoff(
+        allocated,
+        [to_minor_units(amount) for _, amount in rows],
+        [member_id for member_id, _ in rows],
+    )
+    job.eligible_total = total_pool
+    job.allocated_units = from_minor_units(allocated)
+    if cutoff is not None:
+        job.remainder_cutoff, job.cutoff_member_id = cutoff
+    job.investment = Investment.objects.create(
+        recorded_at=job.recorded_at,
+        unit_value=job.unit_value,
+        total_units=job.total_units or job.allocated_units,
+        created_by=job.created_by,
+    )
+    bump_ledger_versions()
+    if not rows:
+        job.status = InvestmentJobStatus.COMPLETED
+        job.finished_at = timezone.now()
+    else:
+        job.status = InvestmentJobStatus.RUNNING
+        job.members_total = len(rows)
+    job.save()
+    InvestmentJobMember.objects.bulk_create(
+        [
+            InvestmentJobMember(job=job, member_id=member_id, eligible_savings=amount)
+            for member_id, amount in rows
+        ],
+        batch_size=HOLDING_SHARE_BATCH_SIZE,
+    )
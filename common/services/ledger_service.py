@@ -0,0 +1,397 @@
+"""
+LedgerProjectionService — keep read models (MemberBalance, GroupBalance,
+EligibleSavingsDay, PositionCheckpoint, StatementSnapshot) and ledger versions
+in step with ledger writes.
+Called inside the writer's transaction.
+"""
+
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Optional
+
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from common.models import (
+    AssetShare,
+    BuyOut,
+    Contribution,
+    EligibleSavingsDay,
+    ExitQueue,
+    ExitRequest,
+    GroupBalance,
+    HoldingShare,
+    Member,
+    MemberBalance,
+    Penalty,
+    PositionCheckpoint,
+    StatementSnapshot,
+)
+from common.models.exit_queue import EXIT_QUEUE_ID
+from common.models.group_balance import GROUP_BALANCE_ID
+from common.models.reversal import ReversalRecordType
+
+ZERO = Decimal("0")
+
+# Ledger model per ReversalRecordType
+REVERSIBLE_MODELS = {
+    ReversalRecordType.CONTRIBUTION: Contribution,
+    ReversalRecordType.PENALTY: Penalty,
+    ReversalRecordType.HOLDING_SHARE: HoldingShare,
+    ReversalRecordType.ASSET_SHARE: AssetShare,
+    ReversalRecordType.EXIT_REQUEST: ExitRequest,
+    ReversalRecordType.BUY_OUT: BuyOut,
+}
+
+
+def ledger_date(value: datetime) -> date:
+    """Calendar date of a ledger timestamp in the current time zone (as __date)."""
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return timezone.localdate(value)
+
+
+def day_start(day: date) -> datetime:
+    """Aware start (00:00) of a calendar day in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def date_range_q(
+    field: str, from_date: Optional[date] = None, to_date: Optional[date] = None
+) -> Q:
+    """
+    Records of timestamp field dated from_date..to_date (inclusive, current time
+    zone) as the half-open range [from_date 00:00, to_date + 1 day 00:00).
+    Same rows as field__date__gte/lte, but sargable on a btree over field.
+    """
+    condition = Q()
+    if from_date is not None:
+        condition &= Q(**{f"{field}__gte": day_start(from_date)})
+    if to_date is not None:
+        condition &= Q(**{f"{field}__lt": day_start(to_date + timedelta(days=1))})
+    return condition
+
+
+def get_member_balance(member: Member) -> MemberBalance:
+    """Return the member's balance row, or an unsaved zero balance if none yet."""
+    balance = MemberBalance.objects.filter(member=member).first()
+    return balance or MemberBalance(member=member)
+
+
+def get_member_ledger_version(member: Member) -> int:
+    """Current ledger version of the member (0 before any write)."""
+    version = (
+        MemberBalance.objects.filter(member=member)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def get_group_balance() -> GroupBalance:
+    """Return the group balance row, or an unsaved zero row if none yet."""
+    balance = GroupBalance.objects.filter(pk=GROUP_BALANCE_ID).first()
+    return balance or GroupBalance(pk=GROUP_BALANCE_ID)
+
+
+def get_group_ledger_version() -> int:
+    """Current group-wide ledger version (0 before any write)."""
+    version = (
+        GroupBalance.objects.filter(pk=GROUP_BALANCE_ID)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def lock_ledger() -> None:
+    """
+    Lock the GroupBalance row until the transaction ends (creating it first if
+    needed). Every ledger write calls this before inserting or changing rows,
+    and statement snapshots and position checkpoints are built under it, so a
+    builder never reads around a write that is still in flight. Lock order:
+    GroupBalance, then ExitQueue, then MemberBalance.
+    """
+    GroupBalance.objects.get_or_create(pk=GROUP_BALANCE_ID)
+    list(
+        GroupBalance.objects.select_for_update()
+        .filter(pk=GROUP_BALANCE_ID)
+        .values_list("pk", flat=True)
+    )
+
+
+def apply_balance_delta(member_id, contributions=ZERO, penalties=ZERO) -> None:
+    """Add contribution/penalty deltas to the member's balance row (created lazily)."""
+    MemberBalance.objects.get_or_create(member_id=member_id)
+    MemberBalance.objects.filter(member_id=member_id).update(
+        contributions_total=F("contributions_total") + contributions,
+        penalties_total=F("penalties_total") + penalties,
+        eligible_savings=F("eligible_savings") + contributions - penalties,
+    )
+
+
+def apply_savings_delta(member_id, record_date: date, delta) -> None:
+    """
+    Add delta (contribution +, penalty -) dated record_date to the member's
+    running eligible savings: that day's row (created from the previous running
+    total if missing) and every later row. Callers hold the member's balance row
+    lock (apply_balance_delta), which serializes writers per member.
+    """
+    days = EligibleSavingsDay.objects.filter(member_id=member_id)
+    if not days.filter(day=record_date).update(
+        daily_delta=F("daily_delta") + delta,
+        running_total=F("running_total") + delta,
+    ):
+        previous = (
+            days.filter(day__lt=record_date)
+            .order_by("-day")
+            .values_list("running_total", flat=True)
+            .first()
+        )
+        EligibleSavingsDay.objects.create(
+            member_id=member_id,
+            day=record_date,
+            daily_delta=delta,
+            running_total=(previous or ZERO) + delta,
+        )
+    days.filter(day__gt=record_date).update(running_total=F("running_total") + delta)
+
+
+def eligible_savings_rows(as_of: date):
+    """
+    (member_id, eligible savings as of as_of) per member with any activity,
+    ordered by member_id: one DISTINCT ON (member) over running totals.
+    """
+    return (
+        EligibleSavingsDay.objects.filter(day__lte=as_of)
+        .order_by("member_id", "-day")
+        .distinct("member_id")
+        .values_list("member_id", "running_total")
+    )
+
+
+def get_eligible_savings_as_of(as_of: date) -> dict:
+    """
+    Eligible savings (contributions - penalties, non-reversed, dated <= as_of)
+    per member with any activity, as member_id -> Decimal.
+    """
+    return dict(eligible_savings_rows(as_of))
+
+
+def get_member_eligible_savings_as_of(member_id, as_of: date) -> Decimal:
+    """Member's eligible savings at the end of as_of (one index seek)."""
+    total = (
+        EligibleSavingsDay.objects.filter(member_id=member_id, day__lte=as_of)
+        .order_by("-day")
+        .values_list("running_total", flat=True)
+        .first()
+    )
+    return total or ZERO
+
+
+def adjust_checkpoints(
+    member_id, record_date: date, contributions=ZERO, penalties=ZERO
+) -> None:
+    """Apply a ledger delta dated record_date to checkpoints on or after that date."""
+    PositionCheckpoint.objects.filter(
+        member_id=member_id, as_of__gte=record_date
+    ).update(
+        contributions_total=F("contributions_total") + contributions,
+        penalties_total=F("penalties_total") + penalties,
+    )
+
+
+def invalidate_statement_snapshots(touched: Iterable[tuple]) -> None:
+    """Delete statement snapshots whose period covers any (member_id, date) given."""
+    condition = Q()
+    for member_id, record_date in set(touched):
+        if member_id is not None:
+            condition |= Q(
+                member_id=member_id,
+                period_start__lte=record_date,
+                period_end__gte=record_date,
+            )
+    if condition:
+        StatementSnapshot.objects.filter(condition).delete()
+
+
+def bump_ledger_versions(
+    member_ids: Iterable = (),
+    member_count: int = 0,
+    pool_total=ZERO,
+    penalties_total=ZERO,
+    holdings_value=ZERO,
+) -> None:
+    """
+    Advance the ledger version of the given members and of the group, applying
+    any group total deltas in the same single-row update.
+    """
+    member_ids = {m for m in member_ids if m is not None}
+    if member_ids:
+        MemberBalance.objects.bulk_create(
+            [MemberBalance(member_id=m) for m in member_ids], ignore_conflicts=True
+        )
+        MemberBalance.objects.filter(member_id__in=member_ids).update(
+            version=F("version") + 1
+        )
+    _update_group_balance(
+        version=F("version") + 1,
+        member_count=F("member_count") + member_count,
+        pool_total=F("pool_total") + pool_total,
+        penalties_total=F("penalties_total") + penalties_total,
+        holdings_value=F("holdings_value") + holdings_value,
+    )
+
+
+def on_contribution_recorded(contribution: Contribution) -> None:
+    """Projection updates for a newly recorded contribution."""
+    record_date = ledger_date(contribution.recorded_at)
+    apply_balance_delta(contribution.member_id, contributions=contribution.amount)
+    apply_savings_delta(contribution.member_id, record_date, contribution.amount)
+    adjust_checkpoints(
+        contribution.member_id, record_date, contributions=contribution.amount
+    )
+    invalidate_statement_snapshots([(contribution.member_id, record_date)])
+    bump_ledger_versions([contribution.member_id], pool_total=contribution.amount)
+
+
+def on_penalty_recorded(penalty: Penalty) -> None:
+    """Projection updates for a newly recorded penalty."""
+    record_date = ledger_date(penalty.recorded_at)
+    apply_balance_delta(penalty.member_id, penalties=penalty.amount)
+    apply_savings_delta(penalty.member_id, record_date, -penalty.amount)
+    adjust_checkpoints(penalty.member_id, record_date, penalties=penalty.amount)
+    invalidate_statement_snapshots([(penalty.member_id, record_date)])
+    bump_ledger_versions([penalty.member_id], penalties_total=penalty.amount)
+
+
+def on_holdings_recorded(investment, member_ids: Optional[Iterable] = None) -> None:
+    """
+    Projection updates for the HoldingShare rows of a newly recorded investment,
+    or only for those of member_ids (one chunk of an investment job).
+    """
+    shares = HoldingShare.objects.filter(investment=investment)
+    if member_ids is not None:
+        shares = shares.filter(member_id__in=member_ids)
+    member_ids = set(shares.values_list("member_id", flat=True))
+    invalidate_statement_snapshots(
+        (member_id, investment.recorded_at) for member_id in member_ids
+    )
+    bump_ledger_versions(member_ids, holdings_value=_holdings_value(shares))
+
+
+def on_buyout_recorded(buyout) -> None:
+    """Projection updates for a newly recorded buy-out."""
+    record_date = ledger_date(buyout.recorded_at)
+    invalidate_statement_snapshots(
+        [(buyout.seller_id, record_date), (buyout.buyer_id, record_date)]
+    )
+    bump_ledger_versions([buyout.seller_id, buyout.buyer_id])
+
+
+def get_exit_queue_version() -> int:
+    """Current exit queue version (0 before the first exit request)."""
+    return (
+        ExitQueue.objects.filter(pk=EXIT_QUEUE_ID)
+        .values_list("version", flat=True)
+        .first()
+        or 0
+    )
+
+
+def bump_exit_queue_version() -> None:
+    """
+    Advance the exit queue version after queued requests change. Call it
+    before bump_ledger_versions: ExitQueue is locked before MemberBalance, as
+    in create_exit_request (see lock_ledger).
+    """
+    ExitQueue.objects.filter(pk=EXIT_QUEUE_ID).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+
+
+def on_records_reversed(record_type: str, record_ids: list[int]) -> None:
+    """Projection updates for ledger rows just flagged is_reversed."""
+    group_deltas = {}
+    touched = []  # (member_id, date) of reversed rows, for snapshot invalidation
+    if record_type == ReversalRecordType.CONTRIBUTION:
+        total_reversed = ZERO
+        for member_id, total in _totals_by_member(Contribution, record_ids):
+            apply_balance_delta(member_id, contributions=-total)
+            total_reversed += total
+        group_deltas["pool_total"] = -total_reversed
+        for member_id, recorded_at, amount in _amount_rows(Contribution, record_ids):
+            record_date = ledger_date(recorded_at)
+            apply_savings_delta(member_id, record_date, -amount)
+            adjust_checkpoints(member_id, record_date, contributions=-amount)
+            touched.append((member_id, record_date))
+    elif record_type == ReversalRecordType.PENALTY:
+        total_reversed = ZERO
+        for member_id, total in _totals_by_member(Penalty, record_ids):
+            apply_balance_delta(member_id, penalties=-total)
+            total_reversed += total
+        group_deltas["penalties_total"] = -total_reversed
+        for member_id, recorded_at, amount in _amount_rows(Penalty, record_ids):
+            record_date = ledger_date(recorded_at)
+            apply_savings_delta(member_id, record_date, amount)
+            adjust_checkpoints(member_id, record_date, penalties=-amount)
+            touched.append((member_id, record_date))
+    elif record_type == ReversalRecordType.HOLDING_SHARE:
+        shares = HoldingShare.objects.filter(pk__in=record_ids)
+        group_deltas["holdings_value"] = -_holdings_value(shares)
+        touched.extend(shares.values_list("member_id", "investment__recorded_at"))
+    elif record_type == ReversalRecordType.BUY_OUT:
+        rows = BuyOut.objects.filter(pk__in=record_ids).values_list(
+            "seller_id", "buyer_id", "recorded_at"
+        )
+        for seller_id, buyer_id, recorded_at in rows:
+            record_date = ledger_date(recorded_at)
+            touched.extend([(seller_id, record_date), (buyer_id, record_date)])
+    elif record_type == ReversalRecordType.EXIT_REQUEST:
+        bump_exit_queue_version()
+    invalidate_statement_snapshots(touched)
+    bump_ledger_versions(_affected_member_ids(record_type, record_ids), **group_deltas)
+
+
+def _holdings_value(shares) -> Decimal:
+    return shares.aggregate(
+        total=Sum(F("units") * F("investment__unit_value"))
+    )["total"] or ZERO
+
+
+def _totals_by_member(model, record_ids):
+    return (
+        model.objects.filter(pk__in=record_ids)
+        .values("member_id")
+        .annotate(total=Sum("amount"))
+        .values_list("member_id", "total")
+    )
+
+
+def _amount_rows(model, record_ids):
+    return model.objects.filter(pk__in=record_ids).values_list(
+        "member_id", "recorded_at", "amount"
+    )
+
+
+def _affected_member_ids(record_type: str, record_ids: list[int]) -> set:
+    if record_type == ReversalRecordType.BUY_OUT:
+        member_ids = set()
+        pairs = BuyOut.objects.filter(pk__in=record_ids).values_list(
+            "seller_id", "buyer_id"
+        )
+        for seller_id, buyer_id in pairs:
+            member_ids.update((seller_id, buyer_id))
+        return member_ids
+    model = REVERSIBLE_MODELS[ReversalRecordType(record_type)]
+    return set(
+        model.objects.filter(pk__in=record_ids).values_list("member_id", flat=True)
+    )
+
+
+def _update_group_balance(**updates) -> None:
+    """Apply F()-expression updates to the single GroupBalance row."""
+    if not GroupBalance.objects.filter(pk=GROUP_BALANCE_ID).update(**updates):
+        GroupBalance.objects.get_or_create(pk=GROUP_BALANCE_ID)
+        GroupBalance.objects.filter(pk=GROUP_BALANCE_ID).update(**updates)
@@ -3,20 +3,29 @@ PositionService — aggregate member position and group aggregates from ledger.
 Excludes reversed records; includes holdings (HoldingShare × unit_value).
 """
 
+from datetime import date, timedelta
 from decimal import Decimal
 
-from django.db.models import Sum
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import Case, F, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import JSONObject
 
 from common.models import (
     AssetShare,
     Contribution,
     ExitRequest,
+    ExitRequestStatus,
     HoldingShare,
     Member,
     Penalty,
-    Reversal,
+    PositionCheckpoint,
+)
+from common.services.exit_service import get_exit_queue_ranks
+from common.services.ledger_service import (
+    date_range_q,
+    day_start,
+    get_group_balance,
 )
-from common.models.reversal import ReversalRecordType
 
 
 # Source-of-truth disclaimer per constitution/spec
@@ -25,109 +34,177 @@ SOURCE_OF_TRUTH_DISCLAIMER = (
 )
 
 
-def _reversed_contribution_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.CONTRIBUTION
-        ).values_list("original_record_id", flat=True)
+def get_member_position(member: Member) -> dict:
+    """
+    Return member's financial position: contributions total, penalties total,
+    holdings_breakdown (HoldingShare × unit_value, excluding reversed),
+    assets_breakdown (AssetShare with recorded_purchase_value, excluding reversed),
+    exit_request (None), source_of_truth_disclaimer.
+    A queued exit_request carries queue_rank, its live place in the queue.
+    Excludes reversed contributions, penalties, holding shares, asset shares.
+    Totals come from the MemberBalance projection; totals, breakdowns and the
+    latest exit are fetched in a single query (JSON subqueries per section).
+    """
+    row = (
+        Member.objects.filter(pk=member.pk)
+        .annotate(
+            holdings=_holdings_array(HoldingShare.objects.active()),
+            assets=_assets_array(AssetShare.objects.active()),
+            latest_exit=_latest_exit(ExitRequest.objects.active(), F("status")),
+        )
+        .values(
+            "balance__contributions_total",
+            "balance__penalties_total",
+            "holdings",
+            "assets",
+            "latest_exit",
+        )
+        .get()
     )
+    data = _position_data(
+        row["balance__contributions_total"] or Decimal("0"),
+        row["balance__penalties_total"] or Decimal("0"),
+        row,
+    )
+    if data["exit_request"] and data["exit_request"]["status"] == (
+        ExitRequestStatus.QUEUED
+    ):
+        data["exit_request"]["queue_rank"] = get_exit_queue_ranks().get(
+            row["latest_exit"]["id"]
+        )
+    return data
 
 
-def _reversed_penalty_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.PENALTY
-        ).values_list("original_record_id", flat=True)
+def get_member_position_as_of(member: Member, as_of: date) -> dict:
+    """
+    Return member's position as it stood at the end of as_of (same shape as
+    get_member_position plus as_of). Totals are the nearest PositionCheckpoint on
+    or before as_of plus the non-reversed ledger delta after it; holdings, assets
+    and the latest exit are limited to records dated on or before as_of.
+    An exit fulfilled after as_of is reported as queued.
+    """
+    checkpoint = (
+        PositionCheckpoint.objects.filter(member=member, as_of__lte=as_of)
+        .order_by("-as_of")
+        .first()
+    )
+    after = checkpoint.as_of + timedelta(days=1) if checkpoint is not None else None
+    delta = date_range_q("recorded_at", after, as_of)
+    contributions = Contribution.objects.active().filter(delta, member=member)
+    penalties = Penalty.objects.active().filter(delta, member=member)
+    contributions_total = penalties_total = Decimal("0")
+    if checkpoint is not None:
+        contributions_total = checkpoint.contributions_total
+        penalties_total = checkpoint.penalties_total
+    contributions_total += contributions.aggregate(total=Sum("amount"))[
+        "total"
+    ] or Decimal("0")
+    penalties_total += penalties.aggregate(total=Sum("amount"))["total"] or Decimal(
+        "0"
     )
 
-
-def _reversed_holding_share_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.HOLDING_SHARE
-        ).values_list("original_record_id", flat=True)
+    exit_status = Case(
+        When(
+            fulfilled_at__gte=day_start(as_of + timedelta(days=1)),
+            then=Value(ExitRequestStatus.QUEUED.value),
+        ),
+        default=F("status"),
+    )
+    row = (
+        Member.objects.filter(pk=member.pk)
+        .annotate(
+            holdings=_holdings_array(
+                HoldingShare.objects.active().filter(investment__recorded_at__lte=as_of)
+            ),
+            assets=_assets_array(
+                AssetShare.objects.active().filter(asset__conversion_at__lte=as_of)
+            ),
+            latest_exit=_latest_exit(
+                ExitRequest.objects.active().filter(
+                    date_range_q("requested_at", to_date=as_of)
+                ),
+                exit_status,
+            ),
+        )
+        .values("holdings", "assets", "latest_exit")
+        .get()
+    )
+    data = _position_data(contributions_total, penalties_total, row)
+    data["as_of"] = as_of.isoformat()
+    return data
+
+
+def _holdings_array(queryset):
+    return ArraySubquery(
+        queryset.filter(member=OuterRef("pk"))
+        .order_by("-created_at")
+        .values(
+            json=JSONObject(
+                investment_id="investment_id",
+                units="units",
+                unit_value="investment__unit_value",
+                recorded_at="investment__recorded_at",
+            )
+        )
     )
 
 
-def _reversed_asset_share_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.ASSET_SHARE
-        ).values_list("original_record_id", flat=True)
+def _assets_array(queryset):
+    return ArraySubquery(
+        queryset.filter(member=OuterRef("pk"))
+        .order_by("-created_at")
+        .values(
+            json=JSONObject(
+                asset_id="asset_id",
+                share_percentage="share_percentage",
+                recorded_purchase_value="asset__recorded_purchase_value",
+            )
+        )
     )
 
 
-def _reversed_exit_request_ids():
-    return set(
-        Reversal.objects.filter(
-            original_record_type=ReversalRecordType.EXIT_REQUEST
-        ).values_list("original_record_id", flat=True)
+def _latest_exit(queryset, status_expression):
+    return Subquery(
+        queryset.filter(member=OuterRef("pk"))
+        .order_by("-requested_at")
+        .values(
+            json=JSONObject(
+                id="id",
+                status=status_expression,
+                queue_position="queue_position",
+                amount_entitled="amount_entitled",
+            )
+        )[:1]
     )
 
 
-def get_member_position(member: Member) -> dict:
-    """
-    Return member's financial position: contributions total, penalties total,
-    holdings_breakdown (HoldingShare × unit_value, excluding reversed),
-    assets_breakdown (AssetShare with recorded_purchase_value, excluding reversed),
-    exit_request (None), source_of_truth_disclaimer.
-    Excludes reversed contributions, penalties, holding shares, asset shares.
-    """
-    rev_contrib = _reversed_contribution_ids()
-    rev_penalty = _reversed_penalty_ids()
-    rev_holding = _reversed_holding_share_ids()
-    rev_asset_share = _reversed_asset_share_ids()
-
-    contributions_total = Contribution.objects.filter(member=member).exclude(
-        id__in=rev_contrib
-    ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
-
-    penalties_total = Penalty.objects.filter(member=member).exclude(
-        id__in=rev_penalty
-    ).aggregate(total=Sum("amount"))["total"] or Decimal("0")
-
-    holdings_breakdown = []
-    for hs in (
-        HoldingShare.objects.filter(member=member)
-        .exclude(id__in=rev_holding)
-        .select_related("investment")
-    ):
-        holdings_breakdown.append(
-            {
-                "investment_id": hs.investment_id,
-                "units": float(hs.units),
-                "unit_value": float(hs.investment.unit_value),
-                "recorded_at": hs.investment.recorded_at.isoformat(),
-            }
-        )
-
-    assets_breakdown = []
-    for as_ in (
-        AssetShare.objects.filter(member=member)
-        .exclude(id__in=rev_asset_share)
-        .select_related("asset")
-    ):
-        assets_breakdown.append(
-            {
-                "asset_id": as_.asset_id,
-                "share_percentage": float(as_.share_percentage),
-                "recorded_purchase_value": float(as_.asset.recorded_purchase_value),
-            }
-        )
+def _position_data(contributions_total, penalties_total, row) -> dict:
+    holdings_breakdown = [
+        {
+            "investment_id": hs["investment_id"],
+            "units": float(hs["units"]),
+            "unit_value": float(hs["unit_value"]),
+            "recorded_at": hs["recorded_at"],
+        }
+        for hs in row["holdings"]
+    ]
+    assets_breakdown = [
+        {
+            "asset_id": as_["asset_id"],
+            "share_percentage": float(as_["share_percentage"]),
+            "recorded_purchase_value": float(as_["recorded_purchase_value"]),
+        }
+        for as_ in row["assets"]
+    ]
 
-    rev_exit = _reversed_exit_request_ids()
     exit_request = None
-    latest_exit = (
-        ExitRequest.objects.filter(member=member)
-        .exclude(id__in=rev_exit)
-        .order_by("-requested_at")
-        .first()
-    )
-    if latest_exit is not None:
+    latest = row["latest_exit"]
+    if latest is not None:
         exit_request = {
-            "status": latest_exit.status,
-            "queue_position": latest_exit.queue_position,
-            "amount_entitled": float(latest_exit.amount_entitled),
+            "status": latest["status"],
+            "queue_position": latest["queue_position"],
+            "queue_rank": None,
+            "amount_entitled": float(latest["amount_entitled"]),
         }
 
     return {
@@ -142,14 +219,14 @@ def get_member_position(member: Member) -> dict:
 
 def get_group_aggregates() -> dict:
     """
-    Return group-level aggregates: total_members, total_pool (sum of non-reversed contributions).
+    Return group-level aggregates: total_members, total_pool (sum of non-reversed
+    contributions), total_penalties, holdings_value (HoldingShare × unit_value).
+    Read from the maintained GroupBalance row (one primary-key lookup).
     """
-    rev_contrib = _reversed_contribution_ids()
-    total_members = Member.objects.count()
-    total_pool = Contribution.objects.exclude(id__in=rev_contrib).aggregate(
-        total=Sum("amount")
-    )["total"] or Decimal("0")
+    balance = get_group_balance()
     return {
-        "total_members": total_members,
-        "total_pool": float(total_pool),
+        "total_members": balance.member_count,
+        "total_pool": float(balance.pool_total),
+        "total_penalties": float(balance.penalties_total),
+        "holdings_value": float(balance.holdings_value),
     }
@@ -0,0 +1,153 @@
+"""
+ReversalService — create Reversal records, flag the reversed ledger row
+(is_reversed) and update projections in the same transaction.
+"""
+
+from typing import Any, Optional
+
+from django.db import IntegrityError, transaction
+
+from common.models import Reversal
+from common.models.reversal import ReversalRecordType
+from common.services.ledger_service import (
+    REVERSIBLE_MODELS,
+    lock_ledger,
+    on_records_reversed,
+)
+
+# Per-item outcomes of reverse_records
+CREATED = "created"
+INVALID = "invalid"
+NOT_FOUND = "not_found"
+ALREADY_REVERSED = "already_reversed"
+
+
+class AlreadyReversedError(ValueError):
+    """Raised when the target record already has a Reversal."""
+
+
+def reverse_records(
+    items: list[dict[str, Any]],
+    created_by: Optional[Any] = None,
+) -> list[dict[str, Any]]:
+    """
+    Reverse many ledger records in one transaction. Each item has
+    original_record_type, original_record_id and optional reason.
+    Targets are validated with one locking query per record type, Reversal rows
+    are inserted with bulk_create and the targets flagged is_reversed.
+    Returns one result per item, in input order: status (created, invalid,
+    not_found, already_reversed), detail, and reversal (Reversal or None).
+    """
+    results: list[Optional[dict[str, Any]]] = [None] * len(items)
+    by_type: dict[ReversalRecordType, list[tuple[int, int, str]]] = {}
+    for index, item in enumerate(items):
+        try:
+            rev_type = ReversalRecordType(item.get("original_record_type"))
+            record_id = int(item.get("original_record_id"))
+        except (TypeError, ValueError):
+            results[index] = _result(
+                item, INVALID, "Invalid original_record_type or original_record_id"
+            )
+            continue
+        by_type.setdefault(rev_type, []).append(
+            (index, record_id, item.get("reason") or "")
+        )
+
+    with transaction.atomic():
+        lock_ledger()
+        pending: list[tuple[int, Reversal]] = []
+        for rev_type, entries in by_type.items():
+            model = REVERSIBLE_MODELS[rev_type]
+            flags = dict(
+                model.objects.select_for_update()
+                .filter(pk__in={record_id for _, record_id, _ in entries})
+                .values_list("pk", "is_reversed")
+            )
+            claimed = set()
+            for index, record_id, reason in entries:
+                item = items[index]
+                if record_id not in flags:
+                    results[index] = _result(
+                        item, NOT_FOUND, "Original record not found"
+                    )
+                elif flags[record_id] or record_id in claimed:
+                    results[index] = _result(
+                        item,
+                        ALREADY_REVERSED,
+                        f"{rev_type.value} {record_id} is already reversed",
+                    )
+                else:
+                    claimed.add(record_id)
+                    pending.append(
+                        (
+                            index,
+                            Reversal(
+                                original_record_type=rev_type.value,
+                                original_record_id=record_id,
+                                reason=reason,
+                                created_by=created_by,
+                            ),
+                        )
+                    )
+        if pending:
+            try:
+                with transaction.atomic():
+                    Reversal.objects.bulk_create([rev for _, rev in pending])
+            except IntegrityError as e:
+                raise AlreadyReversedError(
+                    "One or more records were reversed concurrently"
+                ) from e
+            reversed_ids: dict[str, list[int]] = {}
+            for index, rev in pending:
+                results[index] = _result(items[index], CREATED, "", rev)
+                reversed_ids.setdefault(rev.original_record_type, []).append(
+                    rev.original_record_id
+                )
+            for record_type, ids in reversed_ids.items():
+                REVERSIBLE_MODELS[ReversalRecordType(record_type)].objects.filter(
+                    pk__in=ids
+                ).update(is_reversed=True)
+                on_records_reversed(record_type, ids)
+    return results
+
+
+def _result(item, status, detail, reversal=None) -> dict[str, Any]:
+    return {
+        "original_record_type": item.get("original_record_type"),
+        "original_record_id": item.get("original_record_id"),
+        "status": status,
+        "detail": detail,
+        "reversal": reversal,
+    }
+
+
+def reverse_record(
+    original_record_type: str,
+    original_record_id: int,
+    reason: str = "",
+    created_by: Optional[Any] = None,
+) -> Reversal:
+    """
+    Record a Reversal for a ledger row and mark the row is_reversed atomically.
+    Original record stays stored; aggregation skips it via .active().
+    Raises model.DoesNotExist if the target is missing, AlreadyReversedError if
+    it was already reversed (target row is locked, unique constraint as backstop).
+    """
+    rev_type = ReversalRecordType(original_record_type)
+    (result,) = reverse_records(
+        [
+            {
+                "original_record_type": rev_type.value,
+                "original_record_id": original_record_id,
+                "reason": reason,
+            }
+        ],
+        created_by=created_by,
+    )
+    if result["status"] == INVALID:
+        raise ValueError(result["detail"])
+    if result["status"] == NOT_FOUND:
+        raise REVERSIBLE_MODELS[rev_type].DoesNotExist(result["detail"])
+    if result["status"] == ALREADY_REVERSED:
+        raise AlreadyReversedError(result["detail"])
+    return result["reversal"]
@@ -0,0 +1,39 @@
+"""
+Statement file rendering for batch exports. Stdlib only (no Django imports) so
+it can run in ProcessPoolExecutor workers under any start method.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+from typing import Any
+
+
+def render_statement(statement: dict[str, Any], fmt: str, columns: list[str]) -> bytes:
+    """Render one member statement as JSON or as CSV (one row per record)."""
+    if fmt == "json":
+        return json.dumps(statement, indent=2).encode()
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, restval="")
+    writer.writeheader()
+    for section, rows in statement.items():
+        if isinstance(rows, list):
+            for row in rows:
+                writer.writerow({"section": section, **row})
+    return buffer.getvalue().encode()
+
+
+def write_statement_file(
+    path: str, statement: dict[str, Any], fmt: str, columns: list[str]
+) -> dict[str, Any]:
+    """Render and write a statement file; return its manifest entry."""
+    content = render_statement(statement, fmt, columns)
+    with open(path, "wb") as f:
+        f.write(content)
+    return {
+        "file": os.path.basename(path),
+        "bytes": len(content),
+        "sha256": hashlib.sha256(content).hexdigest(),
+    }
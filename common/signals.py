@@ -0,0 +1,22 @@
+"""
+Signal handlers — Member has no write service (created via Django admin), so
+membership changes update the group member count and ledger version here.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Member
+from .services.ledger_service import bump_ledger_versions
+
+
+@receiver(post_save, sender=Member)
+def member_saved(sender, instance, created, **kwargs):
+    """New member changes group aggregates (total_members)."""
+    if created:
+        bump_ledger_versions(member_count=1)
+
+
+@receiver(post_delete, sender=Member)
+def member_deleted(sender, instance, **kwargs):
+    """Removed member changes group aggregates (total_members)."""
+    bump_ledger_versions(member_count=-1)
@@ -3,13 +3,18 @@ from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 from .views import (
+    AdminMemberPositionView,
     AssetCreateView,
     BuyOutCreateView,
     ContributionCreateView,
     ContributionWindowListCreateView,
+    ExitQueueFulfillView,
+    ExitRequestCancelView,
     ExitRequestListCreateView,
     GroupAggregatesView,
     InvestmentCreateView,
+    InvestmentJobDetailView,
+    InvestmentPreviewView,
     MemberPositionView,
     MemberStatementView,
     PenaltyCreateView,
@@ -43,6 +48,16 @@ urlpatterns = [
         InvestmentCreateView.as_view(),
         name="admin_investments",
     ),
+    path(
+        "admin/investments/preview/",
+        InvestmentPreviewView.as_view(),
+        name="admin_investment_preview",
+    ),
+    path(
+        "admin/investment-jobs/<int:job_id>/",
+        InvestmentJobDetailView.as_view(),
+        name="admin_investment_job",
+    ),
     path(
         "admin/assets/",
         AssetCreateView.as_view(),
@@ -58,10 +73,25 @@ urlpatterns = [
         ExitRequestListCreateView.as_view(),
         name="admin_exit_requests",
     ),
+    path(
+        "admin/exit-requests/<int:exit_request_id>/cancel/",
+        ExitRequestCancelView.as_view(),
+        name="admin_exit_request_cancel",
+    ),
+    path(
+        "admin/exit-requests/fulfill/",
+        ExitQueueFulfillView.as_view(),
+        name="admin_exit_queue_fulfill",
+    ),
     path(
         "admin/buy-outs/",
         BuyOutCreateView.as_view(),
         name="admin_buy_outs",
     ),
+    path(
+        "admin/members/<uuid:member_id>/position/",
+        AdminMemberPositionView.as_view(),
+        name="admin_member_position",
+    ),
     path("test/", test_view, name="test"),
 ]
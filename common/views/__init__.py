@@ -3,12 +3,17 @@ common/views/__init__.py
 """
 
 from .admin_views import (
+    AdminMemberPositionView,
     AssetCreateView,
     BuyOutCreateView,
     ContributionCreateView,
     ContributionWindowListCreateView,
+    ExitQueueFulfillView,
+    ExitRequestCancelView,
     ExitRequestListCreateView,
     InvestmentCreateView,
+    InvestmentJobDetailView,
+    InvestmentPreviewView,
     PenaltyCreateView,
     ReversalCreateView,
 )
@@ -18,13 +23,18 @@ from .statement_views import MemberStatementView
 from .test_view import test_view
 
 __all__ = [
+    "AdminMemberPositionView",
     "AssetCreateView",
     "BuyOutCreateView",
     "ContributionCreateView",
     "ContributionWindowListCreateView",
+    "ExitQueueFulfillView",
+    "ExitRequestCancelView",
     "ExitRequestListCreateView",
     "GroupAggregatesView",
     "InvestmentCreateView",
+    "InvestmentJobDetailView",
+    "InvestmentPreviewView",
     "MemberPositionView",
     "MemberStatementView",
     "PenaltyCreateView",
@@ -1,25 +1,53 @@
 """
 Admin-only views: contribution windows, contributions, penalties, investments,
-assets, reversals, exit-requests, buy-outs.
+investment jobs, assets, reversals, exit-requests (list, create, cancel, fulfil),
+buy-outs, member positions.
 """
 
+import uuid
+
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.models import ContributionWindow, Member, Reversal
+from common.models import ContributionWindow, ExitRequest, InvestmentJob, Member
 from common.permissions import IsAdmin
 from common.services.asset_service import record_asset
 from common.services.contribution_service import (
     record_contribution,
     record_penalty,
 )
-from common.services.exit_service import create_exit_request
-from common.services.investment_service import record_investment
+from common.services.exit_service import (
+    EXIT_PAGE_SIZE,
+    MAX_EXIT_PAGE_SIZE,
+    cancel_exit_request,
+    create_exit_request,
+    fulfill_exit_queue,
+    get_exit_queue_ranks,
+    list_exit_requests,
+)
+from common.services.investment_service import (
+    create_investment_job,
+    preview_investment,
+    record_investment,
+)
+from common.services.position_service import (
+    get_member_position,
+    get_member_position_as_of,
+)
 from common.services.buyout_service import record_buyout
+from common.services.reversal_service import (
+    CREATED,
+    AlreadyReversedError,
+    reverse_record,
+    reverse_records,
+)
 from common.models.reversal import ReversalRecordType
+from common.views.position_views import parse_as_of
 
 
 class ContributionWindowListCreateView(APIView):
@@ -186,8 +214,34 @@ class PenaltyCreateView(APIView):
             )
 
 
+def _is_async(request: Request) -> bool:
+    value = request.data.get("async", request.query_params.get("async"))
+    return value is True or str(value).lower() in ("1", "true")
+
+
+def _investment_job_data(job) -> dict:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "members_total": job.members_total,
+        "members_processed": job.members_processed,
+        "progress": (
+            round(job.members_processed / job.members_total, 4)
+            if job.members_total
+            else None
+        ),
+        "investment_id": job.investment_id,
+        "error": job.error or None,
+        "status_url": reverse("admin_investment_job", args=[job.id]),
+    }
+
+
 class InvestmentCreateView(APIView):
-    """POST /admin/investments/ — admin only, immutable."""
+    """
+    POST /admin/investments/ — admin only, immutable.
+    With async=true (body or query) the allocation is queued as an InvestmentJob
+    for the run_investment_jobs worker and 202 is returned with its status URL.
+    """
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
@@ -201,6 +255,25 @@ class InvestmentCreateView(APIView):
                 {"detail": "recorded_at, unit_value required"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        if _is_async(request):
+            try:
+                job = create_investment_job(
+                    recorded_at=recorded_at,
+                    unit_value=unit_value,
+                    total_units=total_units,
+                    created_by=request.user,
+                )
+            except (TypeError, ArithmeticError):
+                return Response(
+                    {"detail": "unit_value must be a number"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            except ValueError as e:
+                return Response(
+                    {"detail": str(e)},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(_investment_job_data(job), status=status.HTTP_202_ACCEPTED)
         try:
             inv = record_investment(
                 recorded_at=recorded_at,
@@ -217,6 +290,11 @@ class InvestmentCreateView(APIView):
                 },
                 status=status.HTTP_201_CREATED,
             )
+        except (TypeError, ArithmeticError):
+            return Response(
+                {"detail": "unit_value must be a number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         except ValueError as e:
             return Response(
                 {"detail": str(e)},
@@ -224,6 +302,53 @@ class InvestmentCreateView(APIView):
             )
 
 
+class InvestmentPreviewView(APIView):
+    """
+    POST /admin/investments/preview/ — admin only; dry-run allocation, no writes.
+    Body: recorded_at and unit_values (list) or unit_value.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def post(self, request: Request):
+        """Per-member units and totals for each candidate unit value."""
+        recorded_at = request.data.get("recorded_at")
+        unit_values = request.data.get("unit_values")
+        if unit_values is None and request.data.get("unit_value") is not None:
+            unit_values = [request.data.get("unit_value")]
+        if not recorded_at or not isinstance(unit_values, list):
+            return Response(
+                {"detail": "recorded_at and unit_values (list) required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            data = preview_investment(recorded_at, unit_values)
+        except (TypeError, ArithmeticError):
+            return Response(
+                {"detail": "unit_values must be numbers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data)
+
+
+class InvestmentJobDetailView(APIView):
+    """GET /admin/investment-jobs/<id>/ — admin only; async investment progress."""
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request: Request, job_id: int):
+        """Job status, members processed / total, and the Investment id."""
+        job = InvestmentJob.objects.filter(pk=job_id).first()
+        if job is None:
+            return Response(
+                {"detail": "Investment job not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(_investment_job_data(job))
+
+
 class AssetCreateView(APIView):
     """POST /admin/assets/ — admin only, immutable."""
 
@@ -267,13 +392,28 @@ class AssetCreateView(APIView):
             )
 
 
+def _reversal_data(rev) -> dict:
+    return {
+        "id": rev.id,
+        "original_record_type": rev.original_record_type,
+        "original_record_id": rev.original_record_id,
+        "reason": rev.reason,
+        "created_at": rev.created_at.isoformat(),
+    }
+
+
 class ReversalCreateView(APIView):
-    """POST /admin/reversals/ — admin only; create reversal record only."""
+    """
+    POST /admin/reversals/ — admin only; create reversal record, flag original reversed.
+    A JSON list body reverses many records in one transaction (batch mode).
+    """
 
     permission_classes = [IsAuthenticated, IsAdmin]
 
     def post(self, request: Request):
-        """Create reversal record; original unchanged."""
+        """Create reversal record; original kept, marked is_reversed."""
+        if isinstance(request.data, list):
+            return self._post_batch(request)
         original_record_type = request.data.get("original_record_type")
         original_record_id = request.data.get("original_record_id")
         reason = request.data.get("reason", "")
@@ -289,22 +429,71 @@ class ReversalCreateView(APIView):
                 {"detail": "Invalid original_record_type"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        rev = Reversal.objects.create(
-            original_record_type=rev_type.value,
-            original_record_id=int(original_record_id),
-            reason=reason,
-            created_by=request.user,
-        )
-        return Response(
+        try:
+            rev = reverse_record(
+                original_record_type=rev_type,
+                original_record_id=int(original_record_id),
+                reason=reason,
+                created_by=request.user,
+            )
+        except AlreadyReversedError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except ObjectDoesNotExist:
+            return Response(
+                {"detail": "Original record not found"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(_reversal_data(rev), status=status.HTTP_201_CREATED)
+
+    def _post_batch(self, request: Request):
+        """
+        Reverse a list of {original_record_type, original_record_id, reason}.
+        201 when every item was reversed, else 207 with per-item status.
+        """
+        items = request.data
+        if not items or not all(isinstance(item, dict) for item in items):
+            return Response(
+                {"detail": "Non-empty list of reversal objects required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            results = reverse_records(items, created_by=request.user)
+        except AlreadyReversedError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_409_CONFLICT,
+            )
+        data = [
             {
-                "id": rev.id,
-                "original_record_type": rev.original_record_type,
-                "original_record_id": rev.original_record_id,
-                "reason": rev.reason,
-                "created_at": rev.created_at.isoformat(),
-            },
-            status=status.HTTP_201_CREATED,
-        )
+                "original_record_type": r["original_record_type"],
+                "original_record_id": r["original_record_id"],
+                "status": r["status"],
+                "detail": r["detail"],
+                "reversal": _reversal_data(r["reversal"]) if r["reversal"] else None,
+            }
+            for r in results
+        ]
+        if all(r["status"] == CREATED for r in results):
+            return Response(data, status=status.HTTP_201_CREATED)
+        return Response(data, status=status.HTTP_207_MULTI_STATUS)
+
+
+def _exit_request_data(r, queue_ranks: dict) -> dict:
+    """Serialize an ExitRequest for admin responses; queue_rank from queue_ranks."""
+    return {
+        "id": r.id,
+        "member_id": r.member_id,
+        "requested_at": r.requested_at.isoformat(),
+        "queue_position": r.queue_position,
+        "queue_rank": queue_ranks.get(r.id),
+        "status": r.status,
+        "fulfilled_at": r.fulfilled_at.isoformat() if r.fulfilled_at else None,
+        "amount_entitled": str(r.amount_entitled),
+        "created_at": r.created_at.isoformat(),
+    }
 
 
 class ExitRequestListCreateView(APIView):
@@ -313,26 +502,49 @@ class ExitRequestListCreateView(APIView):
     permission_classes = [IsAuthenticated, IsAdmin]
 
     def get(self, request: Request):
-        """List exit queue (all exit requests, ordered by queue_position)."""
-        from common.models import ExitRequest
-
-        requests = ExitRequest.objects.all().order_by("queue_position", "-requested_at")[
-            :100
-        ]
-        data = [
-            {
-                "id": r.id,
-                "member_id": r.member_id,
-                "requested_at": r.requested_at.isoformat(),
-                "queue_position": r.queue_position,
-                "status": r.status,
-                "fulfilled_at": r.fulfilled_at.isoformat() if r.fulfilled_at else None,
-                "amount_entitled": str(r.amount_entitled),
-                "created_at": r.created_at.isoformat(),
-            }
-            for r in requests
-        ]
-        return Response(data)
+        """
+        List exit requests ordered by (queue_position, id); queued ones carry
+        their live queue_rank. Query: status, member_id, limit (default 100),
+        cursor. The next page's URL is in the Link header (rel="next").
+        """
+        params = request.query_params
+        try:
+            limit = int(params.get("limit", EXIT_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= MAX_EXIT_PAGE_SIZE:
+            return Response(
+                {"detail": f"limit must be between 1 and {MAX_EXIT_PAGE_SIZE}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        member_id = params.get("member_id")
+        if member_id is not None:
+            try:
+                member_id = uuid.UUID(member_id)
+            except ValueError:
+                return Response(
+                    {"detail": "Invalid member_id."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        try:
+            requests, next_cursor = list_exit_requests(
+                status=params.get("status"),
+                member_id=member_id,
+                limit=limit,
+                cursor=params.get("cursor"),
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        ranks = get_exit_queue_ranks()
+        response = Response([_exit_request_data(r, ranks) for r in requests])
+        if next_cursor is not None:
+            query = params.copy()
+            query["cursor"] = next_cursor
+            next_url = request.build_absolute_uri(
+                f"{request.path}?{query.urlencode()}"
+            )
+            response["Link"] = f'<{next_url}>; rel="next"'
+        return response
 
     def post(self, request: Request):
         """Create exit request; queue position assigned FIFO."""
@@ -343,27 +555,78 @@ class ExitRequestListCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
         try:
-            req = create_exit_request(member_id=int(member_id))
+            req = create_exit_request(member_id=member_id)
             return Response(
-                {
-                    "id": req.id,
-                    "member_id": req.member_id,
-                    "requested_at": req.requested_at.isoformat(),
-                    "queue_position": req.queue_position,
-                    "status": req.status,
-                    "fulfilled_at": req.fulfilled_at.isoformat() if req.fulfilled_at else None,
-                    "amount_entitled": str(req.amount_entitled),
-                    "created_at": req.created_at.isoformat(),
-                },
+                _exit_request_data(req, get_exit_queue_ranks()),
                 status=status.HTTP_201_CREATED,
             )
-        except Member.DoesNotExist:
+        except (Member.DoesNotExist, ValidationError):
             return Response(
                 {"detail": "Member not found"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
 
+class ExitRequestCancelView(APIView):
+    """POST /admin/exit-requests/<id>/cancel/ — admin only; queued requests only."""
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def post(self, request: Request, exit_request_id: int):
+        """Cancel the exit request; it leaves the queue."""
+        try:
+            req = cancel_exit_request(exit_request_id)
+        except ExitRequest.DoesNotExist:
+            return Response(
+                {"detail": "Exit request not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(_exit_request_data(req, {}))
+
+
+class ExitQueueFulfillView(APIView):
+    """
+    POST /admin/exit-requests/fulfill/ — admin only.
+    Body: liquidity. Fulfills queued requests FIFO while liquidity allows.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def post(self, request: Request):
+        """Pay out the queue in order; returns what was paid and what stays queued."""
+        liquidity = request.data.get("liquidity")
+        if liquidity is None:
+            return Response(
+                {"detail": "liquidity required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            result = fulfill_exit_queue(liquidity)
+        except (TypeError, ArithmeticError):
+            return Response(
+                {"detail": "liquidity must be a number"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(
+            {
+                "liquidity": str(result["liquidity"]),
+                "paid_total": str(result["paid_total"]),
+                "remaining_liquidity": str(result["remaining_liquidity"]),
+                "fulfilled": [
+                    _exit_request_data(r, {}) for r in result["fulfilled"]
+                ],
+                "still_queued": {
+                    "count": result["still_queued"]["count"],
+                    "amount_total": str(result["still_queued"]["amount_total"]),
+                },
+            }
+        )
+
+
 class BuyOutCreateView(APIView):
     """POST /admin/buy-outs/ — admin only, immutable."""
 
@@ -410,3 +673,27 @@ class BuyOutCreateView(APIView):
                 {"detail": "Member (seller or buyer) not found"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+class AdminMemberPositionView(APIView):
+    """
+    GET /admin/members/<member_id>/position/ — admin only; any member's position,
+    optionally as of a date (?as_of=YYYY-MM-DD) for dispute resolution.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdmin]
+
+    def get(self, request: Request, member_id):
+        """Get member position, current or as of a date."""
+        member = Member.objects.filter(pk=member_id).first()
+        if member is None:
+            return Response(
+                {"detail": "Member not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        as_of, error = parse_as_of(request)
+        if error:
+            return error
+        if as_of is not None:
+            return Response(get_member_position_as_of(member, as_of))
+        return Response(get_member_position(member))
@@ -1,22 +1,33 @@
 """
 GET /group/aggregates/ — group-level aggregates (thin view, calls PositionService).
 """
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.permissions import IsMemberReadOwnAndAggregates
+from common.services.ledger_service import get_group_ledger_version
 from common.services.position_service import get_group_aggregates
 
 
+def group_aggregates_etag(request, *args, **kwargs):
+    """ETag from the group ledger version; unchanged ledger -> 304."""
+    return f"group-{get_group_ledger_version()}"
+
+
 class GroupAggregatesView(APIView):
     """
-    GET: Return group aggregates (total_members, total_pool). No per-member data.
+    GET: Return group aggregates (total_members, total_pool, total_penalties,
+    holdings_value). No per-member data.
     Requires authenticated user with linked Member and MEMBER role.
+    Supports If-None-Match (304) against the group ledger version.
     """
 
     permission_classes = [IsAuthenticated, IsMemberReadOwnAndAggregates]
 
+    @method_decorator(condition(etag_func=group_aggregates_etag))
     def get(self, request):
         """
         Get group aggregates
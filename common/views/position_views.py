@@ -1,25 +1,74 @@
 """
 GET /me/position/ — member's own financial position (thin view, calls PositionService).
+Optional ?as_of=YYYY-MM-DD returns the position as it stood at the end of that date.
 """
 
+from datetime import datetime
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.permissions import IsMemberReadOwnAndAggregates, get_member
-from common.services.position_service import get_member_position
+from common.services.ledger_service import (
+    get_exit_queue_version,
+    get_member_ledger_version,
+)
+from common.services.position_service import (
+    get_member_position,
+    get_member_position_as_of,
+)
+
+
+def parse_as_of(request):
+    """Return (as_of date or None, error Response or None) from ?as_of=."""
+    as_of_str = request.query_params.get("as_of")
+    if not as_of_str:
+        return None, None
+    try:
+        return datetime.strptime(as_of_str, "%Y-%m-%d").date(), None
+    except ValueError:
+        return None, Response(
+            {"detail": "as_of must be YYYY-MM-DD."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+
+def position_etag(request, *args, **kwargs):
+    """
+    ETag from the member's ledger version and, for the current position, the
+    exit queue version (queue_rank); with as_of, the date instead.
+    Unchanged ledger -> 304.
+    """
+    member = get_member(request.user)
+    if not member:
+        return None
+    etag = f"position-{member.pk}-{get_member_ledger_version(member)}"
+    as_of_str = request.GET.get("as_of")
+    if not as_of_str:
+        return f"{etag}-q{get_exit_queue_version()}"
+    try:
+        as_of = datetime.strptime(as_of_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+    return f"{etag}-{as_of.isoformat()}"
 
 
 class MemberPositionView(APIView):
     """
     GET: Return member's financial position
-    (contributions, penalties, holdings, assets, exit, disclaimer).
+    (contributions, penalties, holdings, assets, exit, disclaimer);
+    with as_of, the position at the end of that date.
     Requires authenticated user with linked Member and MEMBER role.
+    Supports If-None-Match (304) against the member's ledger version.
     """
 
     permission_classes = [IsAuthenticated, IsMemberReadOwnAndAggregates]
 
+    @method_decorator(condition(etag_func=position_etag))
     def get(self, request):
         """
         Get member position
@@ -30,5 +79,10 @@ class MemberPositionView(APIView):
                 {"detail": "Member profile not found."},
                 status=status.HTTP_403_FORBIDDEN,
             )
+        as_of, error = parse_as_of(request)
+        if error:
+            return error
+        if as_of is not None:
+            return Response(get_member_position_as_of(member, as_of))
         data = get_member_position(member)
         return Response(data)
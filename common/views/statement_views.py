@@ -1,30 +1,72 @@
 """
 GET /me/statement/ — member's historical statement (contributions, penalties,
 investments, exits) for date range; member own only.
+?format=ndjson|csv streams the statement as one row per record.
+?limit=N[&cursor=...] pages sections by keyset on (date, id).
 """
 
+import hashlib
 from datetime import datetime
 
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 from common.permissions import IsMemberReadOwnAndAggregates, get_member
-from common.services.statement_service import get_member_statement
+from common.renderers import CSVRenderer, NDJSONRenderer, stream_csv, stream_ndjson
+from common.services.ledger_service import get_member_ledger_version
+from common.services.statement_service import (
+    MAX_PAGE_SIZE,
+    STATEMENT_COLUMNS,
+    get_member_statement,
+    get_member_statement_page,
+    iter_member_statement,
+)
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def statement_etag(request, *args, **kwargs):
+    """ETag from the member's ledger version, query string and Accept header."""
+    member = get_member(request.user)
+    if not member:
+        return None
+    variant = "|".join(
+        (request.META.get("QUERY_STRING", ""), request.META.get("HTTP_ACCEPT", ""))
+    )
+    query = hashlib.sha256(variant.encode()).hexdigest()
+    return f"statement-{member.pk}-{get_member_ledger_version(member)}-{query[:16]}"
 
 
 class MemberStatementView(APIView):
     """
     GET: Return member's historical statement for date range (from_date, to_date).
     Requires authenticated user with linked Member and MEMBER role.
+    Supports If-None-Match (304) against the member's ledger version.
+    format=ndjson|csv streams rows ({"section": ..., **record}) with constant memory.
+    limit and/or cursor switch to keyset pages: limit rows per section plus
+    next (section -> cursor); passing a cursor returns that section's next page.
     """
 
     permission_classes = [IsAuthenticated, IsMemberReadOwnAndAggregates]
+    renderer_classes = [
+        *api_settings.DEFAULT_RENDERER_CLASSES,
+        NDJSONRenderer,
+        CSVRenderer,
+    ]
 
+    @method_decorator(condition(etag_func=statement_etag))
     def get(self, request: Request):
-        """Get member statement; query params from_date, to_date (YYYY-MM-DD)."""
+        """
+        Get member statement; query params from_date, to_date (YYYY-MM-DD),
+        optional limit and cursor for paging.
+        """
         member = get_member(request.user)
         if not member:
             return Response(
@@ -56,5 +98,56 @@ class MemberStatementView(APIView):
                 {"detail": "from_date must be before or equal to to_date."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        export_format = request.accepted_renderer.format
+        if export_format in (NDJSONRenderer.format, CSVRenderer.format):
+            return self._stream(request, member, from_date, to_date)
+        limit_str = request.query_params.get("limit")
+        cursor = request.query_params.get("cursor")
+        if limit_str is not None or cursor is not None:
+            limit = DEFAULT_PAGE_SIZE
+            if limit_str is not None:
+                try:
+                    limit = int(limit_str)
+                except ValueError:
+                    limit = 0
+                if not 1 <= limit <= MAX_PAGE_SIZE:
+                    return Response(
+                        {"detail": f"limit must be between 1 and {MAX_PAGE_SIZE}."},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+            try:
+                data = get_member_statement_page(
+                    member,
+                    from_date=from_date,
+                    to_date=to_date,
+                    limit=limit,
+                    cursor=cursor,
+                )
+            except ValueError:
+                return Response(
+                    {"detail": "Invalid cursor."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(data)
         data = get_member_statement(member, from_date=from_date, to_date=to_date)
         return Response(data)
+
+    def _stream(self, request: Request, member, from_date, to_date):
+        rows = (
+            {"section": section, **row}
+            for section, row in iter_member_statement(
+                member, from_date=from_date, to_date=to_date
+            )
+        )
+        renderer = request.accepted_renderer
+        if renderer.format == CSVRenderer.format:
+            content = stream_csv(rows, STATEMENT_COLUMNS)
+        else:
+            content = stream_ndjson(rows)
+        response = StreamingHttpResponse(
+            content, content_type=f"{renderer.media_type}; charset={renderer.charset}"
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="statement.{renderer.format}"'
+        )
+        return response
@@ -3,6 +3,7 @@ Pytest configuration for Plots & Prosper backend.
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 User = get_user_model()
 
@@ -11,3 +12,10 @@ User = get_user_model()
 def django_db_setup():
     """Use real DB for tests that need it (integration/contract)."""
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached values are keyed on DB versions, which roll back between tests."""
+    cache.clear()
+    yield
@@ -4,13 +4,17 @@ Record asset with shares; position shows asset share and recorded value.
 """
 
 from datetime import date, datetime
+from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from common.models import (
+    AssetShare,
     Contribution,
     ContributionWindow,
     HoldingShare,
@@ -18,6 +22,7 @@ from common.models import (
     Member,
 )
 from common.models.member import MemberRole
+from common.services.asset_service import _holding_value_per_member_as_of, record_asset
 
 User = get_user_model()
 
@@ -171,3 +176,65 @@ class TestAssetConversion:
         assert "asset_id" in asset_item
         assert "share_percentage" in asset_item
         assert "recorded_purchase_value" in asset_item
+
+    def test_asset_share_percentages_sum_to_exactly_100(
+        self, admin_client, member_user, investment_with_holding
+    ):
+        """Three equal holders get 33.3334 / 33.3333 / 33.3333."""
+        for n in range(2, 4):
+            other = Member.objects.create(
+                firstName="Holder",
+                lastName=str(n),
+                email=f"holder{n}@example.com",
+                phone=f"+25570000010{n}",
+                nationalId=f"holder{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            HoldingShare.objects.create(
+                investment=investment_with_holding, member=other, units=500
+            )
+        response = admin_client.post(
+            "/api/v1/admin/assets/",
+            {
+                "name": "Property B",
+                "recorded_purchase_value": "90000.00",
+                "conversion_at": "2026-03-01",
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        shares = AssetShare.objects.filter(asset_id=response.json()["id"])
+        percentages = sorted(s.share_percentage for s in shares)
+        assert percentages == [
+            Decimal("33.3333"),
+            Decimal("33.3333"),
+            Decimal("33.3334"),
+        ]
+        assert sum(percentages) == Decimal("100")
+
+    def test_holding_valuation_is_one_grouped_query(
+        self, member_user, investment_with_holding
+    ):
+        """Per-member value is summed in the database; shares are one insert."""
+        _, member = member_user
+        later = Investment.objects.create(
+            recorded_at=date(2026, 2, 10), unit_value="2.5", total_units=10
+        )
+        HoldingShare.objects.create(investment=later, member=member, units=10)
+        with CaptureQueriesContext(connection) as ctx:
+            values = _holding_value_per_member_as_of(date(2026, 3, 1))
+        assert len(ctx.captured_queries) == 1
+        assert values == {member.id: Decimal("525")}
+        assert _holding_value_per_member_as_of(date(2026, 2, 5)) == {
+            member.id: Decimal("500")
+        }
+
+        with CaptureQueriesContext(connection) as ctx:
+            asset = record_asset("Plot C", Decimal("1000"), "2026-03-01")
+        inserts = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('INSERT INTO "common_assetshare"')
+        ]
+        assert len(inserts) == 1
+        assert asset.asset_shares.get().share_percentage == Decimal("100")
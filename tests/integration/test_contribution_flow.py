@@ -3,20 +3,46 @@ Integration tests for contribution flow (US2).
 Record contribution, penalty, investment; verify position and no edit/delete.
 """
 
+import threading
+import time
 from datetime import date, datetime
+from decimal import Decimal
 
 import pytest
+from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from common.models import (
+    AssetShare,
+    BuyOut,
     Contribution,
     ContributionWindow,
+    HoldingShare,
+    Investment,
+    InvestmentJob,
     Member,
     Penalty,
 )
 from common.models.member import MemberRole
+from common.services import investment_service
+from common.services.contribution_service import record_contribution, record_penalty
+from common.services.investment_service import (
+    _run_investment_job_step,
+    create_investment_job,
+    record_investment,
+    run_investment_job,
+)
+from common.services.ledger_service import (
+    get_eligible_savings_as_of,
+    get_group_balance,
+    get_member_balance,
+    get_member_eligible_savings_as_of,
+)
+from common.services.reversal_service import reverse_record
 
 User = get_user_model()
 
@@ -175,3 +201,294 @@ class TestContributionFlow:
             status.HTTP_404_NOT_FOUND,
             status.HTTP_405_METHOD_NOT_ALLOWED,
         )
+        # Django admin cannot change or delete them (or other ledger rows) either
+        for model in (Contribution, Penalty, HoldingShare, AssetShare, BuyOut):
+            model_admin = admin.site._registry[model]
+            assert not model_admin.has_change_permission(None)
+            assert not model_admin.has_delete_permission(None)
+
+    def test_record_investment_round_trips_independent_of_members(
+        self, contribution_window
+    ):
+        """Holding shares are inserted in batches; query count does not grow."""
+
+        def add_saver(n):
+            member = Member.objects.create(
+                firstName="Saver",
+                lastName=str(n),
+                email=f"saver{n}@example.com",
+                phone=f"+2557001000{n:02d}",
+                nationalId=f"saver{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            record_contribution(
+                member_id=member.id,
+                window_id=contribution_window.id,
+                amount="100.00",
+                recorded_at=datetime(2026, 1, 10),
+            )
+
+        def queries_for_investment():
+            with CaptureQueriesContext(connection) as ctx:
+                record_investment(recorded_at=date(2026, 1, 20), unit_value="10")
+            return len(ctx.captured_queries)
+
+        add_saver(1)
+        few = queries_for_investment()
+        for n in range(2, 12):
+            add_saver(n)
+        many = queries_for_investment()
+        assert many == few
+        assert HoldingShare.objects.count() == 1 + 11
+
+    def test_running_eligible_savings_track_backdated_writes_and_reversals(
+        self, member_user, contribution_window
+    ):
+        """Running totals match a full re-aggregation after out-of-order writes."""
+        _, member = member_user
+
+        def contribute(amount, day):
+            return record_contribution(
+                member_id=member.id,
+                window_id=contribution_window.id,
+                amount=amount,
+                recorded_at=datetime(2026, 1, day),
+            )
+
+        contribute("100.00", 10)
+        late = contribute("300.00", 20)
+        contribute("150.00", 5)  # backdated before existing days
+        record_penalty(
+            member_id=member.id, amount="20.00", recorded_at=datetime(2026, 1, 15)
+        )
+        reverse_record("contribution", late.id)
+
+        expected = {
+            date(2026, 1, 4): Decimal("0"),
+            date(2026, 1, 5): Decimal("150"),
+            date(2026, 1, 14): Decimal("250"),
+            date(2026, 1, 15): Decimal("230"),
+            date(2026, 1, 31): Decimal("230"),
+        }
+        for as_of, total in expected.items():
+            assert get_member_eligible_savings_as_of(member.id, as_of) == total
+            assert get_eligible_savings_as_of(as_of).get(member.id, 0) == total
+
+    def test_async_investment_job_resumes_without_duplicates(
+        self, api_client_admin, member_user, contribution_window
+    ):
+        """async=true returns 202; a worker resumes after a partial run."""
+        for n in range(1, 4):
+            member = Member.objects.create(
+                firstName="Saver",
+                lastName=str(n),
+                email=f"saver{n}@example.com",
+                phone=f"+2557001000{n:02d}",
+                nationalId=f"saver{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            record_contribution(
+                member_id=member.id,
+                window_id=contribution_window.id,
+                amount="200.00",
+                recorded_at=datetime(2026, 1, 10),
+            )
+        response = api_client_admin.post(
+            "/api/v1/admin/investments/",
+            {"recorded_at": "2026-01-20", "unit_value": "10", "async": True},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        job_id = response.json()["job_id"]
+
+        # Worker "crashes" after creating the investment and one chunk
+        versions = {
+            m.pk: get_member_balance(m).version for m in Member.objects.all()
+        }
+        _run_investment_job_step(job_id, chunk_size=2)
+        _run_investment_job_step(job_id, chunk_size=2)
+        partial = api_client_admin.get(response.json()["status_url"]).json()
+        assert partial["status"] == "running"
+        assert partial["members_processed"] == 2
+        # The committed chunk is already in the projections and member versions
+        assert get_group_balance().holdings_value == Decimal("400")
+        allocated = set(HoldingShare.objects.values_list("member_id", flat=True))
+        assert len(allocated) == 2
+        for m in Member.objects.all():
+            bumped = get_member_balance(m).version > versions[m.pk]
+            assert bumped == (m.pk in allocated)
+
+        job = run_investment_job(job_id, chunk_size=2)
+        assert job.status == "completed"
+        done = api_client_admin.get(response.json()["status_url"]).json()
+        assert done["members_processed"] == done["members_total"] == 3
+        assert done["investment_id"] == job.investment_id
+        shares = HoldingShare.objects.filter(investment_id=job.investment_id)
+        assert shares.count() == 3
+        assert {s.units for s in shares} == {Decimal("20")}
+        assert get_group_balance().holdings_value == Decimal("600")
+
+    def test_investment_preview_writes_nothing(
+        self, api_client_admin, member_user, contribution_window
+    ):
+        """Preview returns units per candidate unit value without recording."""
+        _, member = member_user
+        record_contribution(
+            member_id=member.id,
+            window_id=contribution_window.id,
+            amount="300.00",
+            recorded_at=datetime(2026, 1, 10),
+        )
+        response = api_client_admin.post(
+            "/api/v1/admin/investments/preview/",
+            {"recorded_at": "2026-01-20", "unit_values": ["10", "3"]},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["member_count"] == 1
+        assert Decimal(data["eligible_total"]) == Decimal("300")
+        assert [Decimal(s["total_units"]) for s in data["scenarios"]] == [
+            Decimal("30"),
+            Decimal("100"),
+        ]
+        assert Investment.objects.count() == 0
+        assert HoldingShare.objects.count() == 0
+
+        for unit_values in (["0"], [None], [{}], ["ten"], ["Infinity"], ["NaN"]):
+            bad = api_client_admin.post(
+                "/api/v1/admin/investments/preview/",
+                {"recorded_at": "2026-01-20", "unit_values": unit_values},
+                format="json",
+            )
+            assert bad.status_code == status.HTTP_400_BAD_REQUEST
+        for unit_value in ({}, ["10"], "ten", "Infinity"):
+            for query in ("", "?async=true"):
+                bad = api_client_admin.post(
+                    f"/api/v1/admin/investments/{query}",
+                    {"recorded_at": "2026-01-20", "unit_value": unit_value},
+                    format="json",
+                )
+                assert bad.status_code == status.HTTP_400_BAD_REQUEST
+        assert Investment.objects.count() == 0
+        assert InvestmentJob.objects.count() == 0
+
+    def test_holding_units_reconcile_exactly_in_sync_and_chunked_runs(
+        self, member_user, contribution_window
+    ):
+        """Largest remainder: units sum to the investment total, chunked or not."""
+        for n in range(1, 4):
+            member = Member.objects.create(
+                firstName="Saver",
+                lastName=str(n),
+                email=f"saver{n}@example.com",
+                phone=f"+2557001000{n:02d}",
+                nationalId=f"saver{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            record_contribution(
+                member_id=member.id,
+                window_id=contribution_window.id,
+                amount="100.00",
+                recorded_at=datetime(2026, 1, 10),
+            )
+        inv = record_investment(recorded_at="2026-01-20", unit_value="3")
+        job = run_investment_job(
+            create_investment_job(recorded_at="2026-01-20", unit_value="3").id,
+            chunk_size=1,
+        )
+
+        def units_by_member(investment_id):
+            return {
+                s.member_id: s.units
+                for s in HoldingShare.objects.filter(investment_id=investment_id)
+            }
+
+        units = units_by_member(inv.id)
+        assert sorted(units.values()) == [
+            Decimal("33.3333"),
+            Decimal("33.3333"),
+            Decimal("33.3334"),
+        ]
+        assert sum(units.values()) == inv.total_units == Decimal("100")
+        assert units_by_member(job.investment_id) == units
+
+    def test_investment_job_allocates_from_snapshot_taken_at_start(
+        self, member_user, contribution_window
+    ):
+        """A backdated write mid-job does not change the job's allocation."""
+        _, member = member_user
+        record_contribution(
+            member_id=member.id,
+            window_id=contribution_window.id,
+            amount="400.00",
+            recorded_at=datetime(2026, 1, 10),
+        )
+        job = create_investment_job(recorded_at="2026-01-20", unit_value="10")
+        _run_investment_job_step(job.id, chunk_size=1)
+
+        record_contribution(
+            member_id=member.id,
+            window_id=contribution_window.id,
+            amount="100.00",
+            recorded_at=datetime(2026, 1, 12),
+        )
+        job = run_investment_job(job.id, chunk_size=1)
+        assert job.status == "completed"
+        units = HoldingShare.objects.filter(investment_id=job.investment_id)
+        assert [s.units for s in units] == [Decimal("40")]
+        assert job.investment.total_units == Decimal("40")
+        assert not job.members.exists()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestInvestmentConcurrency:
+    """Allocations read eligible savings under the ledger lock."""
+
+    def test_backdated_write_waits_for_allocation(
+        self, monkeypatch, member_user, contribution_window
+    ):
+        """A write racing record_investment commits after it, not in between."""
+        _, member = member_user
+        record_contribution(
+            member_id=member.id,
+            window_id=contribution_window.id,
+            amount="400.00",
+            recorded_at=datetime(2026, 1, 10),
+        )
+        reading = threading.Event()
+        read_rows = investment_service.eligible_savings_rows
+
+        def slow_rows(as_of):
+            rows = list(read_rows(as_of))
+            reading.set()
+            time.sleep(0.5)  # give the writer time to get as far as it can
+            return rows
+
+        monkeypatch.setattr(investment_service, "eligible_savings_rows", slow_rows)
+        written, errors = [], []
+
+        def write():
+            try:
+                reading.wait()
+                written.append(
+                    record_contribution(
+                        member_id=member.id,
+                        window_id=contribution_window.id,
+                        amount="100.00",
+                        recorded_at=datetime(2026, 1, 12),
+                    )
+                )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        inv = record_investment(recorded_at="2026-01-20", unit_value="10")
+        writer.join()
+
+        assert errors == []
+        assert inv.total_units == Decimal("40")
+        assert written[0].created_at > inv.created_at
@@ -3,16 +3,24 @@ Integration tests for exit queue and buy-out (US4).
 Create exit request, fulfill or queue; record buy-out; verify position and audit trail.
 """
 
+import io
+import threading
 from datetime import date, datetime
+from decimal import Decimal
 
 import pytest
+from django.contrib import admin
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from common.models import (
     Contribution,
     ContributionWindow,
+    ExitQueue,
+    ExitRequest,
     Member,
 )
 from common.models.exit_request import ExitRequestStatus
@@ -204,3 +212,260 @@ class TestExitQueueAndBuyOut:
         assert "queue_position" in first
         assert "status" in first
         assert "member_id" in first
+
+    def test_batch_fulfilment_pays_queue_in_order_up_to_liquidity(
+        self, admin_client, member_user
+    ):
+        """FIFO: stops at the first request the remaining liquidity cannot pay."""
+        _, member = member_user
+        for position, amount in enumerate(["300", "200", "400", "50"], start=1):
+            ExitRequest.objects.create(
+                member=member, queue_position=position, amount_entitled=amount
+            )
+        response = admin_client.post(
+            "/api/v1/admin/exit-requests/fulfill/",
+            {"liquidity": "600"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [r["queue_position"] for r in data["fulfilled"]] == [1, 2]
+        assert Decimal(data["paid_total"]) == Decimal("500")
+        assert Decimal(data["remaining_liquidity"]) == Decimal("100")
+        assert data["still_queued"]["count"] == 2
+        assert Decimal(data["still_queued"]["amount_total"]) == Decimal("450")
+        statuses = dict(ExitRequest.objects.values_list("queue_position", "status"))
+        assert statuses == {
+            1: ExitRequestStatus.FULFILLED,
+            2: ExitRequestStatus.FULFILLED,
+            3: ExitRequestStatus.QUEUED,
+            4: ExitRequestStatus.QUEUED,
+        }
+
+        for liquidity in ("-1", "lots", ["600"], {"amount": "600"}, "Infinity", "NaN"):
+            bad = admin_client.post(
+                "/api/v1/admin/exit-requests/fulfill/",
+                {"liquidity": liquidity},
+                format="json",
+            )
+            assert bad.status_code == status.HTTP_400_BAD_REQUEST
+        # Rejected liquidity pays nobody
+        assert ExitRequest.objects.filter(status=ExitRequestStatus.QUEUED).count() == 2
+
+    def test_float_liquidity_is_read_as_written(self, admin_client, member_user):
+        """A JSON float 0.3 pays a 0.3000 entitlement; amounts keep 4 places."""
+        _, member = member_user
+        ExitRequest.objects.create(
+            member=member, queue_position=1, amount_entitled="0.3000"
+        )
+        response = admin_client.post(
+            "/api/v1/admin/exit-requests/fulfill/",
+            {"liquidity": 0.3},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["fulfilled"]) == 1
+        assert data["liquidity"] == "0.3000"
+        assert data["remaining_liquidity"] == "0.0000"
+
+    def test_exit_queue_listing_filters_and_follows_link_cursor(
+        self, admin_client, admin_user, member_user
+    ):
+        """status/member filters; keyset pages on (queue_position, id) via Link."""
+        _, admin_member = admin_user
+        _, member = member_user
+        for position in range(1, 6):
+            ExitRequest.objects.create(
+                member=member if position % 2 else admin_member,
+                queue_position=position,
+                status=(
+                    ExitRequestStatus.FULFILLED
+                    if position == 2
+                    else ExitRequestStatus.QUEUED
+                ),
+            )
+        url = "/api/v1/admin/exit-requests/?status=queued&limit=2"
+        positions = []
+        while url:
+            response = admin_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            positions.extend(r["queue_position"] for r in response.json())
+            link = response.headers.get("Link")
+            url = link[1 : link.index(">")] if link else None
+        assert positions == [1, 3, 4, 5]
+
+        mine = admin_client.get(
+            f"/api/v1/admin/exit-requests/?member_id={member.id}"
+        ).json()
+        assert [r["queue_position"] for r in mine] == [1, 3, 5]
+
+        for query in ("status=waiting", "cursor=nope", "limit=0", "member_id=1"):
+            response = admin_client.get(f"/api/v1/admin/exit-requests/?{query}")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_queue_rank_is_live_and_changes_position_etag(
+        self, admin_client, member_client, admin_user, member_user
+    ):
+        """Rank counts only requests still ahead; queue changes bust the ETag."""
+        _, admin_member = admin_user
+        _, member = member_user
+        other = Member.objects.create(
+            firstName="Other",
+            lastName="Exit",
+            email="other_exit@example.com",
+            phone="+255700000022",
+            nationalId="id022",
+            joinDate=date(2025, 1, 1),
+        )
+        first = create_exit_request(admin_member.id)
+        create_exit_request(other.id)
+        mine = create_exit_request(member.id)
+
+        response = member_client.get("/api/v1/me/position/")
+        assert response.json()["exit_request"]["queue_rank"] == 3
+        etag = response["ETag"]
+
+        fulfill_exit_request(first.id)
+        response = member_client.get("/api/v1/me/position/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        exit_request = response.json()["exit_request"]
+        assert exit_request["queue_position"] == mine.queue_position
+        assert exit_request["queue_rank"] == 2
+
+        listed = admin_client.get("/api/v1/admin/exit-requests/").json()
+        assert [(r["status"], r["queue_rank"]) for r in listed] == [
+            (ExitRequestStatus.FULFILLED, None),
+            (ExitRequestStatus.QUEUED, 1),
+            (ExitRequestStatus.QUEUED, 2),
+        ]
+
+    def test_cancel_leaves_queue_and_changes_position_etag(
+        self, admin_client, member_client, admin_user, member_user
+    ):
+        """Cancelling advances the queue version: ranks and ETags follow."""
+        _, admin_member = admin_user
+        _, member = member_user
+        first = create_exit_request(admin_member.id)
+        create_exit_request(member.id)
+        response = member_client.get("/api/v1/me/position/")
+        assert response.json()["exit_request"]["queue_rank"] == 2
+        etag = response["ETag"]
+
+        url = f"/api/v1/admin/exit-requests/{first.id}/cancel/"
+        response = admin_client.post(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == ExitRequestStatus.CANCELLED
+
+        response = member_client.get("/api/v1/me/position/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["exit_request"]["queue_rank"] == 1
+        listed = admin_client.get("/api/v1/admin/exit-requests/").json()
+        assert [(r["status"], r["queue_rank"]) for r in listed] == [
+            (ExitRequestStatus.CANCELLED, None),
+            (ExitRequestStatus.QUEUED, 1),
+        ]
+
+        assert admin_client.post(url).status_code == status.HTTP_400_BAD_REQUEST
+        missing = admin_client.post("/api/v1/admin/exit-requests/0/cancel/")
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        model_admin = admin.site._registry[ExitRequest]
+        assert not model_admin.has_add_permission(None)
+        assert not model_admin.has_change_permission(None)
+        assert not model_admin.has_delete_permission(None)
+
+
+
+@pytest.mark.django_db(transaction=True)
+class TestExitQueuePositions:
+    """Queue positions from the locked ExitQueue counter."""
+
+    def test_concurrent_exit_requests_get_distinct_positions(self):
+        """Threads (separate connections) never share a queue position."""
+        members = [
+            Member.objects.create(
+                firstName="Leaver",
+                lastName=str(n),
+                email=f"leaver{n}@example.com",
+                phone=f"+2557002000{n:02d}",
+                nationalId=f"leaver{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            for n in range(8)
+        ]
+        barrier = threading.Barrier(len(members))
+        errors = []
+
+        def create(member_id):
+            try:
+                barrier.wait()
+                create_exit_request(member_id)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=create, args=(m.id,)) for m in members]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        positions = sorted(ExitRequest.objects.values_list("queue_position", flat=True))
+        assert positions == list(range(positions[0], positions[0] + len(members)))
+
+        # Positions are never reused after fulfilment
+        first = ExitRequest.objects.get(queue_position=positions[0])
+        fulfill_exit_request(first.id)
+        assert create_exit_request(first.member_id).queue_position == positions[-1] + 1
+
+    def test_concurrent_create_and_fulfil_do_not_deadlock(self):
+        """Creates and fulfilments lock ExitQueue and balances in one order."""
+        members = [
+            Member.objects.create(
+                firstName="Racer",
+                lastName=str(n),
+                email=f"racer{n}@example.com",
+                phone=f"+2557003000{n:02d}",
+                nationalId=f"racer{n}",
+                joinDate=date(2025, 1, 1),
+            )
+            for n in range(20)
+        ]
+        queued = [create_exit_request(m.id) for m in members[:10]]
+        calls = [(create_exit_request, m.id) for m in members[10:]] + [
+            (fulfill_exit_request, req.id) for req in queued
+        ]
+        barrier = threading.Barrier(len(calls))
+        errors = []
+
+        def run(func, arg):
+            try:
+                barrier.wait()
+                func(arg)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=call) for call in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert (
+            ExitRequest.objects.filter(status=ExitRequestStatus.QUEUED).count() == 10
+        )
+
+    def test_benchmark_command_reports_unique_positions(self):
+        """benchmark_exit_queue checks positions under concurrent creates."""
+        out = io.StringIO()
+        call_command(
+            "benchmark_exit_queue", "--workers", "4", "--per-worker", "5", stdout=out
+        )
+        assert "20 positions" in out.getvalue()
+        assert "All positions unique and contiguous." in out.getvalue()
+        # Ran on its own throwaway database
+        assert not ExitRequest.objects.exists()
+        assert not ExitQueue.objects.exists()
@@ -2,15 +2,29 @@
 Integration tests for member position (US1).
 Authenticated member GET /me/position/, GET /group/aggregates/, RBAC.
 """
-from datetime import date
+import threading
+import time
+from datetime import date, datetime
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from common.models import Member
+from common.models import (
+    Contribution,
+    ContributionWindow,
+    Member,
+    PositionCheckpoint,
+)
 from common.models.member import MemberRole
+from common.services import checkpoint_service
+from common.services.checkpoint_service import create_position_checkpoints
+from common.services.contribution_service import record_contribution, record_penalty
+from common.services.investment_service import record_investment
+from common.services.position_service import get_group_aggregates, get_member_position
+from common.services.reversal_service import reverse_record
 
 User = get_user_model()
 
@@ -73,6 +87,12 @@ class TestMemberPosition:
         assert isinstance(data["holdings_breakdown"], list)
         assert isinstance(data["assets_breakdown"], list)
 
+    def test_position_is_single_query(self, member_user, django_assert_num_queries):
+        """Totals, breakdowns and latest exit are fetched in one round trip."""
+        _, member = member_user
+        with django_assert_num_queries(1):
+            get_member_position(member)
+
     def test_unauthenticated_gets_403(self):
         """Unauthenticated request returns 403."""
         client = APIClient()
@@ -114,8 +134,176 @@ class TestGroupAggregates:
         assert isinstance(data["total_members"], int)
         assert isinstance(data["total_pool"], (int, float))
 
+    def test_aggregates_follow_ledger_writes(
+        self, member_user, django_assert_num_queries
+    ):
+        """Maintained totals track writes and reversals; read is one query."""
+        _, member = member_user
+        window = ContributionWindow.objects.create(
+            start_at=datetime(2026, 1, 1),
+            end_at=datetime(2026, 1, 31),
+            name="2026-01",
+        )
+        kept = record_contribution(member_id=member.id, window_id=window.id, amount="400")
+        dropped = record_contribution(
+            member_id=member.id, window_id=window.id, amount="100"
+        )
+        record_penalty(member_id=member.id, amount="50", reason="Late")
+        reverse_record("contribution", dropped.id)
+        record_investment(recorded_at=date.today(), unit_value="10")
+
+        with django_assert_num_queries(1):
+            data = get_group_aggregates()
+        assert data["total_members"] == Member.objects.count()
+        assert data["total_pool"] == float(kept.amount)
+        assert data["total_penalties"] == 50.0
+        assert data["holdings_value"] == 350.0
+
     def test_unauthenticated_gets_403(self):
         """Unauthenticated request returns 403."""
         client = APIClient()
         response = client.get("/api/v1/group/aggregates/")
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestLedgerVersionETags:
+    """ETag / If-None-Match on member read endpoints, keyed on ledger versions."""
+
+    def test_position_not_modified_until_ledger_write(
+        self, api_client_with_auth, member_user
+    ):
+        """Same ledger version -> 304; a contribution bumps the version -> 200."""
+        _, member = member_user
+        client = api_client_with_auth
+        first = client.get("/api/v1/me/position/")
+        assert first.status_code == status.HTTP_200_OK
+        etag = first["ETag"]
+
+        again = client.get("/api/v1/me/position/", HTTP_IF_NONE_MATCH=etag)
+        assert again.status_code == status.HTTP_304_NOT_MODIFIED
+
+        window = ContributionWindow.objects.create(
+            start_at=datetime(2026, 1, 1),
+            end_at=datetime(2026, 1, 31),
+            name="2026-01",
+        )
+        record_contribution(member_id=member.id, window_id=window.id, amount="100")
+        changed = client.get("/api/v1/me/position/", HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed["ETag"] != etag
+
+    def test_group_aggregates_not_modified(self, api_client_with_auth):
+        """Group aggregates answer If-None-Match with 304 while nothing changes."""
+        client = api_client_with_auth
+        etag = client.get("/api/v1/group/aggregates/")["ETag"]
+        response = client.get("/api/v1/group/aggregates/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+class TestPositionAsOf:
+    """GET /me/position/?as_of= — nearest checkpoint plus ledger delta."""
+
+    def test_as_of_uses_checkpoint_and_delta(self, api_client_with_auth, member_user):
+        """Checkpoint at window close stays correct after backdated writes and reversals."""
+        _, member = member_user
+        window = ContributionWindow.objects.create(
+            start_at=datetime(2026, 1, 1),
+            end_at=datetime(2026, 1, 31),
+            name="2026-01",
+        )
+        jan = record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount="500",
+            recorded_at=datetime(2026, 1, 15),
+        )
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount="300",
+            recorded_at=datetime(2026, 2, 15),
+        )
+        create_position_checkpoints(date(2026, 1, 31))
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount="100",
+            recorded_at=datetime(2026, 1, 20),
+        )
+        reverse_record("contribution", jan.id)
+
+        checkpoint = PositionCheckpoint.objects.get(member=member)
+        assert checkpoint.contributions_total == 100
+
+        client = api_client_with_auth
+        january = client.get("/api/v1/me/position/", {"as_of": "2026-01-31"}).json()
+        assert january["as_of"] == "2026-01-31"
+        assert january["contributions_total"] == 100.0
+        february = client.get("/api/v1/me/position/", {"as_of": "2026-02-28"}).json()
+        assert february["contributions_total"] == 400.0
+        before = client.get("/api/v1/me/position/", {"as_of": "2025-12-31"}).json()
+        assert before["contributions_total"] == 0.0
+
+    def test_invalid_as_of_returns_400(self, api_client_with_auth):
+        """as_of must be YYYY-MM-DD."""
+        response = api_client_with_auth.get(
+            "/api/v1/me/position/", {"as_of": "31/01/2026"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPositionCheckpointConcurrency:
+    """Checkpoints never miss a ledger write in flight while they are built."""
+
+    def test_write_during_checkpoint_build_is_counted(self, monkeypatch, member_user):
+        """A contribution racing the build is in the checkpoint either way."""
+        _, member = member_user
+        window = ContributionWindow.objects.create(
+            start_at=datetime(2026, 1, 1),
+            end_at=datetime(2026, 1, 31),
+            name="2026-01",
+        )
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount="500",
+            recorded_at=datetime(2026, 1, 10),
+        )
+        building = threading.Event()
+        totals_by_member = checkpoint_service._totals_by_member
+
+        def slow_totals(model, as_of):
+            totals = totals_by_member(model, as_of)
+            if model is Contribution:
+                building.set()
+                time.sleep(0.5)  # give the writer time to get as far as it can
+            return totals
+
+        monkeypatch.setattr(checkpoint_service, "_totals_by_member", slow_totals)
+        errors = []
+
+        def write():
+            try:
+                building.wait()
+                record_contribution(
+                    member_id=member.id,
+                    window_id=window.id,
+                    amount="75",
+                    recorded_at=datetime(2026, 1, 20),
+                )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        create_position_checkpoints(date(2026, 1, 31))
+        writer.join()
+
+        assert errors == []
+        checkpoint = PositionCheckpoint.objects.get(member=member)
+        assert checkpoint.contributions_total == 575
@@ -0,0 +1,204 @@
+"""
+Integration tests for reversals.
+Reverse ledger records via POST /admin/reversals/; verify aggregates exclude them.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.models import Contribution, ContributionWindow, Member
+from common.models.member import MemberRole
+from common.services.contribution_service import record_contribution
+from common.services.position_service import get_member_position
+from common.services.statement_service import get_member_statement
+
+User = get_user_model()
+
+
+@pytest.fixture
+def admin_user(db):
+    """User linked to Member with ADMIN role."""
+    user = User.objects.create_user(
+        username="admin_rev",
+        password="testpass123",
+        email="admin_rev@example.com",
+    )
+    member = Member.objects.create(
+        firstName="Admin",
+        lastName="Rev",
+        email="admin_rev@example.com",
+        phone="+255700000040",
+        nationalId="id040",
+        joinDate=date(2025, 1, 1),
+        user=user,
+        roles=[MemberRole.MEMBER, MemberRole.ADMIN],
+    )
+    return user, member
+
+
+@pytest.fixture
+def member_user(db):
+    """User linked to Member with MEMBER role."""
+    user = User.objects.create_user(
+        username="member_rev",
+        password="testpass123",
+        email="member_rev@example.com",
+    )
+    member = Member.objects.create(
+        firstName="Member",
+        lastName="Rev",
+        email="member_rev@example.com",
+        phone="+255700000041",
+        nationalId="id041",
+        joinDate=date(2025, 1, 1),
+        user=user,
+        roles=[MemberRole.MEMBER],
+    )
+    return user, member
+
+
+@pytest.fixture
+def admin_client(admin_user):
+    """APIClient authenticated as admin with JWT."""
+    client = APIClient()
+    resp = client.post(
+        "/api/v1/auth/token/",
+        {"username": "admin_rev", "password": "testpass123"},
+        format="json",
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {resp.json()['access']}")
+    return client
+
+
+@pytest.fixture
+def member_client(member_user):
+    """APIClient authenticated as member with JWT."""
+    client = APIClient()
+    resp = client.post(
+        "/api/v1/auth/token/",
+        {"username": "member_rev", "password": "testpass123"},
+        format="json",
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {resp.json()['access']}")
+    return client
+
+
+@pytest.fixture
+def contributions(db, member_user):
+    """Two contributions for the member in one window."""
+    _, member = member_user
+    window = ContributionWindow.objects.create(
+        start_at=datetime(2026, 1, 1),
+        end_at=datetime(2026, 1, 31),
+        min_amount=0,
+        max_amount=10000,
+        name="2026-01",
+    )
+    return [
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount=amount,
+            recorded_at=datetime(2026, 1, 15),
+        )
+        for amount in ("500.00", "200.00")
+    ]
+
+
+@pytest.mark.django_db
+class TestReversals:
+    """Reversed records stay stored but drop out of member aggregates."""
+
+    def test_reversed_contribution_excluded_from_position(
+        self, admin_client, member_client, contributions
+    ):
+        """Reverse one contribution; position total and active() exclude it."""
+        response = admin_client.post(
+            "/api/v1/admin/reversals/",
+            {
+                "original_record_type": "contribution",
+                "original_record_id": contributions[0].id,
+                "reason": "Entered twice",
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        active_ids = set(Contribution.objects.active().values_list("id", flat=True))
+        assert contributions[0].id not in active_ids
+        assert contributions[1].id in active_ids
+        contributions[0].refresh_from_db()
+        assert contributions[0].is_reversed is True
+
+        pos = member_client.get("/api/v1/me/position/").json()
+        assert float(pos["contributions_total"]) == 200.0
+
+    def test_double_reversal_returns_409(self, admin_client, contributions):
+        """Second reversal of the same record is rejected with 409."""
+        payload = {
+            "original_record_type": "contribution",
+            "original_record_id": contributions[0].id,
+        }
+        first = admin_client.post("/api/v1/admin/reversals/", payload, format="json")
+        assert first.status_code == status.HTTP_201_CREATED
+        second = admin_client.post("/api/v1/admin/reversals/", payload, format="json")
+        assert second.status_code == status.HTTP_409_CONFLICT
+
+    def test_reversal_of_missing_record_returns_400(self, admin_client, contributions):
+        """Reversal target must exist."""
+        response = admin_client.post(
+            "/api/v1/admin/reversals/",
+            {
+                "original_record_type": "penalty",
+                "original_record_id": contributions[0].id + 100000,
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_member_reads_do_not_query_reversals(self, member_user, contributions):
+        """Position and statement skip reversed rows by flag; no Reversal reads."""
+        _, member = member_user
+        with CaptureQueriesContext(connection) as ctx:
+            get_member_position(member)
+            get_member_statement(member)
+        assert ctx.captured_queries
+        assert not [q for q in ctx.captured_queries if "common_reversal" in q["sql"]]
+
+    def test_batch_reversal_returns_per_item_results(self, admin_client, contributions):
+        """List body reverses many records at once; invalid items reported per item."""
+        response = admin_client.post(
+            "/api/v1/admin/reversals/",
+            [
+                {
+                    "original_record_type": "contribution",
+                    "original_record_id": contributions[0].id,
+                    "reason": "Wrong run",
+                },
+                {
+                    "original_record_type": "contribution",
+                    "original_record_id": contributions[1].id,
+                    "reason": "Wrong run",
+                },
+                {
+                    "original_record_type": "contribution",
+                    "original_record_id": contributions[1].id,
+                },
+                {"original_record_type": "bogus", "original_record_id": 1},
+            ],
+            format="json",
+        )
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        statuses = [item["status"] for item in response.json()]
+        assert statuses == ["created", "created", "already_reversed", "invalid"]
+        assert not Contribution.objects.active().filter(
+            pk__in=[c.id for c in contributions]
+        ).exists()
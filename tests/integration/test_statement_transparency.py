@@ -3,15 +3,32 @@ Integration tests for statement export and transparency (US5).
 GET /me/statement/, disclaimer in /me/position/, auditor 403 on POST admin.
 """
 
-from datetime import date
+import csv
+import io
+import json
+import threading
+import time
+from datetime import date, datetime
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from common.models import Member
+from common.models import ContributionWindow, Member, StatementSnapshot
 from common.models.member import MemberRole
+from common.services import statement_service
+from common.services.buyout_service import record_buyout
+from common.services.contribution_service import record_contribution, record_penalty
+from common.services.reversal_service import reverse_record
+from common.services.statement_service import (
+    create_statement_snapshots,
+    get_member_statement,
+    windows_needing_snapshots,
+)
 
 User = get_user_model()
 
@@ -124,6 +141,33 @@ def admin_client(admin_user):
     return client
 
 
+@pytest.fixture
+def ledger_records(member_user):
+    """Contributions (same timestamp) and a penalty for the member."""
+    _, member = member_user
+    window = ContributionWindow.objects.create(
+        start_at=datetime(2026, 1, 1),
+        end_at=datetime(2026, 1, 31),
+        name="2026-01",
+    )
+    contributions = [
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount=amount,
+            recorded_at=datetime(2026, 1, 10),
+        )
+        for amount in ("300.00", "100.00", "200.00")
+    ]
+    penalty = record_penalty(
+        member_id=member.id,
+        amount="25.00",
+        reason="Late",
+        recorded_at=datetime(2026, 1, 5),
+    )
+    return contributions, penalty
+
+
 @pytest.mark.django_db
 class TestStatementTransparency:
     """Statement export, disclaimer in position, auditor read-only."""
@@ -196,3 +240,239 @@ class TestStatementTransparency:
             format="json",
         )
         assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_statement_streams_ndjson(self, member_client, ledger_records):
+        """format=ndjson streams one record per line, ordered by (date, id)."""
+        contributions, penalty = ledger_records
+        response = member_client.get("/api/v1/me/statement/", {"format": "ndjson"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [(r["section"], r["id"]) for r in rows] == [
+            *[("contributions", c.id) for c in contributions],
+            ("penalties", penalty.id),
+        ]
+        assert rows == [
+            {"section": section, **row}
+            for section, items in member_client.get("/api/v1/me/statement/")
+            .json()
+            .items()
+            if isinstance(items, list)
+            for row in items
+        ]
+
+    def test_statement_streams_csv(self, member_client, ledger_records):
+        """format=csv streams a header and one row per record."""
+        response = member_client.get(
+            "/api/v1/me/statement/", {"format": "csv", "to_date": "2026-01-07"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        body = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert [r["section"] for r in rows] == ["penalties"]
+        assert rows[0]["reason"] == "Late"
+
+    def test_statement_keyset_pages(self, member_client, ledger_records):
+        """limit pages each section; following next cursors walks a section in order."""
+        contributions, penalty = ledger_records
+        first = member_client.get("/api/v1/me/statement/", {"limit": 2}).json()
+        assert [c["id"] for c in first["contributions"]] == [
+            c.id for c in contributions[:2]
+        ]
+        assert [p["id"] for p in first["penalties"]] == [penalty.id]
+        assert first["next"]["penalties"] is None
+
+        second = member_client.get(
+            "/api/v1/me/statement/",
+            {"limit": 2, "cursor": first["next"]["contributions"]},
+        ).json()
+        assert [c["id"] for c in second["contributions"]] == [contributions[2].id]
+        assert "penalties" not in second
+        assert second["next"] == {"contributions": None}
+
+    def test_statement_invalid_cursor_returns_400(self, member_client):
+        """Malformed cursor is rejected."""
+        response = member_client.get("/api/v1/me/statement/", {"cursor": "bogus"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_statement_range_filters_are_sargable(self, member_user, ledger_records):
+        """Date range compiles to timestamp bounds, not a cast of recorded_at."""
+        _, member = member_user
+        with CaptureQueriesContext(connection) as ctx:
+            statement = get_member_statement(
+                member, from_date=date(2026, 1, 6), to_date=date(2026, 1, 10)
+            )
+        assert len(statement["contributions"]) == 3
+        assert statement["penalties"] == []
+        assert not [q for q in ctx.captured_queries if "AT TIME ZONE" in q["sql"]]
+
+    def test_closed_window_served_from_snapshot(self, member_user, ledger_records):
+        """Snapshot + live tail equals the live statement; reversal invalidates it."""
+        _, member = member_user
+        contributions, _ = ledger_records
+        window = contributions[0].window
+        record_contribution(
+            member_id=member.id,
+            window_id=window.id,
+            amount="50.00",
+            recorded_at=datetime(2026, 2, 3),
+        )
+        live = get_member_statement(member)
+
+        assert create_statement_snapshots(window) == Member.objects.count()
+        snapshot = StatementSnapshot.objects.get(member=member, window=window)
+        assert len(snapshot.sections["contributions"]) == 3
+        assert get_member_statement(member) == live
+
+        snapshot.sections["penalties"][0]["reason"] = "From snapshot"
+        snapshot.save()
+        assert get_member_statement(member)["penalties"][0]["reason"] == "From snapshot"
+
+        reverse_record("contribution", contributions[1].id)
+        assert not StatementSnapshot.objects.filter(member=member).exists()
+        ids = [c["id"] for c in get_member_statement(member)["contributions"]]
+        assert contributions[1].id not in ids
+        assert len(ids) == 3
+
+    def test_snapshot_stores_buy_outs(self, member_user, admin_user, ledger_records):
+        """Buy-out rows (member UUIDs) are stored in and served from snapshots."""
+        _, member = member_user
+        _, buyer = admin_user
+        contributions, _ = ledger_records
+        record_buyout(
+            seller_id=member.id,
+            buyer_id=buyer.id,
+            nominal_valuation="1500.00",
+            recorded_at=datetime(2026, 1, 20),
+        )
+        live = get_member_statement(member)
+        assert live["buy_outs"][0]["seller_id"] == str(member.id)
+
+        assert create_statement_snapshots(contributions[0].window) == (
+            Member.objects.count()
+        )
+        snapshot = StatementSnapshot.objects.get(member=member)
+        assert snapshot.sections["buy_outs"][0]["buyer_id"] == str(buyer.id)
+        assert get_member_statement(member) == live
+
+    def test_adjacent_windows_are_not_reprocessed(self, member_user, ledger_records):
+        """A window sharing a boundary day with a snapshotted one gets done."""
+        contributions, _ = ledger_records
+        january = contributions[0].window
+        february = ContributionWindow.objects.create(
+            start_at=january.end_at,
+            end_at=datetime(2026, 2, 28),
+            name="2026-02",
+        )
+        assert windows_needing_snapshots() == [january, february]
+        create_statement_snapshots(january)
+        # January's snapshots cover every member on the shared day, so February
+        # is satisfied rather than returned (and skipped) on every run
+        assert create_statement_snapshots(february) == 0
+        assert windows_needing_snapshots() == []
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAnnualStatements:
+    """generate_annual_statements — one file per member plus manifest."""
+
+    def test_generates_file_per_member_and_manifest(
+        self, tmp_path, member_user, ledger_records
+    ):
+        """Files match get_member_statement for the year; manifest lists them."""
+        _, member = member_user
+        call_command(
+            "generate_annual_statements",
+            "--year",
+            "2026",
+            "--output-dir",
+            str(tmp_path),
+            "--workers",
+            "2",
+            stdout=io.StringIO(),
+        )
+        manifest = json.loads((tmp_path / "manifest.json").read_text())
+        assert manifest["member_count"] == Member.objects.count()
+        assert {f["file"] for f in manifest["files"]} == {
+            f"statement-{m.pk}.json" for m in Member.objects.all()
+        }
+        statement = json.loads((tmp_path / f"statement-{member.pk}.json").read_text())
+        assert statement == get_member_statement(
+            member, from_date=date(2026, 1, 1), to_date=date(2026, 12, 31)
+        )
+
+    def test_statement_files_include_buy_outs(
+        self, tmp_path, member_user, admin_user, ledger_records
+    ):
+        """A member with a buy-out gets a file with the buy-out row."""
+        _, member = member_user
+        _, buyer = admin_user
+        record_buyout(
+            seller_id=member.id,
+            buyer_id=buyer.id,
+            nominal_valuation="1500.00",
+            recorded_at=datetime(2026, 3, 1),
+        )
+        call_command(
+            "generate_annual_statements",
+            "--year",
+            "2026",
+            "--output-dir",
+            str(tmp_path),
+            "--workers",
+            "2",
+            stdout=io.StringIO(),
+        )
+        statement = json.loads((tmp_path / f"statement-{member.pk}.json").read_text())
+        assert [(b["seller_id"], b["buyer_id"]) for b in statement["buy_outs"]] == [
+            (str(member.id), str(buyer.id))
+        ]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestStatementSnapshotConcurrency:
+    """Snapshots never miss a ledger write in flight while they are built."""
+
+    def test_write_during_snapshot_build_is_not_lost(
+        self, monkeypatch, member_user, ledger_records
+    ):
+        """A contribution racing the build ends up in the statement either way."""
+        _, member = member_user
+        contributions, _ = ledger_records
+        window = contributions[0].window
+        building = threading.Event()
+        read_sections = statement_service.get_section_querysets
+
+        def slow_read(*args, **kwargs):
+            building.set()
+            time.sleep(0.5)  # give the writer time to get as far as it can
+            return read_sections(*args, **kwargs)
+
+        monkeypatch.setattr(statement_service, "get_section_querysets", slow_read)
+        errors = []
+
+        def write():
+            try:
+                building.wait()
+                record_contribution(
+                    member_id=member.id,
+                    window_id=window.id,
+                    amount="75.00",
+                    recorded_at=datetime(2026, 1, 15),
+                )
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        create_statement_snapshots(window)
+        writer.join()
+        monkeypatch.undo()
+
+        assert errors == []
+        amounts = [c["amount"] for c in get_member_statement(member)["contributions"]]
+        assert 75.0 in amounts
@@ -0,0 +1,62 @@
+"""
+Unit tests for the largest-remainder allocation engine.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from common.services.allocation import (
+    allocate,
+    allocate_slice,
+    extra_unit_cutoff,
+    from_minor_units,
+    to_minor_units,
+)
+
+
+class TestAllocate:
+    """Parts sum exactly to the total and stay within one unit of exact."""
+
+    def test_leftover_goes_to_largest_remainders(self):
+        assert allocate(1_000_000, [1, 1, 1]) == [333_334, 333_333, 333_333]
+        assert allocate(10, [5, 3, 2]) == [5, 3, 2]
+        assert allocate(7, [1, 2, 4, 0]) == [1, 2, 4, 0]
+        assert allocate(5, [1, 1, 1, 3]) == [1, 1, 1, 2]
+        assert allocate(2, [1, 1, 1]) == [1, 1, 0]
+
+    def test_parts_sum_to_total(self):
+        weights = [(i * 7919) % 1013 + 1 for i in range(5000)]
+        for total in (0, 1, 999, 123_456_789):
+            parts = allocate(total, weights)
+            assert sum(parts) == total
+            weight_sum = sum(weights)
+            assert all(
+                abs(part - w * total / weight_sum) < 1
+                for part, w in zip(parts, weights)
+            )
+
+    def test_slices_match_whole_allocation(self):
+        weights = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        total = 1001
+        cutoff = extra_unit_cutoff(total, weights)
+        keys = range(len(weights))
+        parts = allocate_slice(
+            total, sum(weights), weights[:4], keys[:4], cutoff
+        ) + allocate_slice(total, sum(weights), weights[4:], keys[4:], cutoff)
+        assert parts == allocate(total, weights)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            allocate(10, [0, 0])
+        with pytest.raises(ValueError):
+            allocate(10, [1, -1])
+        with pytest.raises(ValueError):
+            allocate(-1, [1])
+
+
+def test_minor_unit_round_trip():
+    assert to_minor_units(Decimal("12.3456")) == 123456
+    assert to_minor_units("0.00005") == 1
+    assert to_minor_units(Decimal("1.5"), places=0) == 2
+    assert from_minor_units(123456) == Decimal("12.3456")